@@ -60,7 +60,7 @@ def process(
     log_level = "DEBUG" if not verbose else settings.log_level
     setup_logging(level=log_level, log_file=settings.log_file)
 
-    settings.parallel_processing=sequential
+    settings.parallel_processing = not sequential
     if do_print:
         settings.auto_print = do_print
     console.print(f"[yellow]DRUCK-MODUS AKTIVIERT[/yellow] (Drucker: {settings.printer_sw} / {settings.printer_color})")
@@ -363,6 +363,45 @@ def credentials(
     console.print("Verfügbar: setup, check, delete")
 
 
+@app.command()
+def user(
+    action: str = typer.Argument(..., help="Aktion: 'invalidate' zum Verwerfen gecachter Benutzerdaten"),
+    username: Optional[str] = typer.Argument(None, help="RZ-Kennung (z.B. abc12345)"),
+    all_users: bool = typer.Option(
+        False, "--all", help="Kompletten Benutzercache leeren"
+    ),
+) -> None:
+    """
+    Verwaltet den LDAP-Benutzercache.
+
+    Nach Änderungen im LDAP (Name, Fakultät, E-Mail) werden die Daten
+    sonst erst nach Ablauf von USER_CACHE_TTL_SECONDS neu abgefragt.
+    """
+    setup_logging(level=settings.log_level)
+
+    if action != "invalidate":
+        console.print(f"[red]Unbekannte Aktion: {action}[/red]")
+        console.print("Verfügbar: invalidate")
+        raise typer.Exit(1)
+
+    if all_users == bool(username):
+        console.print("[red]Entweder eine RZ-Kennung oder --all angeben[/red]")
+        raise typer.Exit(1)
+
+    from ..services import UserService
+
+    user_service = UserService()
+    try:
+        if all_users:
+            user_service.invalidate_all()
+            console.print("[green]✓[/green] Benutzercache geleert")
+        else:
+            user_service.invalidate_user(username)
+            console.print(f"[green]✓[/green] Cache-Eintrag für {username} verworfen")
+    finally:
+        user_service.close()
+
+
 def _display_summary(orders: list, organizer: FileOrganizer) -> None:
     """Zeigt Zusammenfassung der verarbeiteten Aufträge."""
     console.print("\n[bold blue]Zusammenfassung[/bold blue]\n")
@@ -40,8 +40,8 @@ class Settings(BaseSettings):
     )
     ldap_bind_password: Optional[str] = Field(default=None, description="LDAP Bind Password")
     ldap_search_filter: str = Field(
-        default="samAccountName={username}",
-        description="LDAP Search Filter Template"
+        default="(&(objectCategory=person)(samAccountName={username}))",
+        description="LDAP Search Filter Template (objectCategory ist in AD indiziert)"
     )
     
     # Fallback Dateien
@@ -54,6 +54,16 @@ class Settings(BaseSettings):
         description="Blacklist Datei"
     )
     
+    # Persistenter Cache für LDAP-Benutzer
+    user_cache_path: Optional[Path] = Field(
+        default=Path("data/user_cache.sqlite"),
+        description="SQLite-Cache für LDAP-Benutzer (leer = deaktiviert)"
+    )
+    user_cache_ttl_seconds: int = Field(
+        default=14 * 24 * 3600,
+        description="Gültigkeit gecachter LDAP-Benutzer in Sekunden"
+    )
+    
     # Preise (in Euro)
     price_sw: float = Field(default=0.04, description="Seitenpreis Schwarz-Weiß")
     price_color: float = Field(default=0.10, description="Seitenpreis Farbe")
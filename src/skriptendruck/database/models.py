@@ -56,7 +56,6 @@ class OrderRecord(Base):
     
     # Dateipfade (relativ oder absolut)
     original_filepath: Mapped[Optional[str]] = mapped_column(String(500))
-    coversheet_path: Mapped[Optional[str]] = mapped_column(String(500))
     merged_pdf_path: Mapped[Optional[str]] = mapped_column(String(500))
     
     def __repr__(self) -> str:
@@ -87,7 +87,6 @@ class DatabaseService:
                 processed_at=order.processed_at,
                 operator=order.operator,
                 original_filepath=str(order.filepath) if order.filepath else None,
-                coversheet_path=str(order.coversheet_path) if order.coversheet_path else None,
                 merged_pdf_path=str(order.merged_pdf_path) if order.merged_pdf_path else None,
             )
             
@@ -1,5 +1,6 @@
 """Datenmodelle für Aufträge."""
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -66,7 +67,6 @@ class Order(BaseModel):
     operator: Optional[str] = Field(default=None, description="Bearbeiter")
     
     # Output Pfade
-    coversheet_path: Optional[Path] = Field(default=None, description="Pfad zum Deckblatt")
     merged_pdf_path: Optional[Path] = Field(default=None, description="Pfad zum fertigen PDF")
     
     @property
@@ -79,6 +79,11 @@ class Order(BaseModel):
         """Prüft ob der Auftrag einen Fehler hat."""
         return self.status.value.startswith("error")
     
+    @cached_property
+    def target_name(self) -> str:
+        """Dateiname für Ausgabe-/Fehlerordner (Auftrags-ID als Präfix)."""
+        return f"{self.order_id:04d}_{self.filename}"
+    
     def set_error(self, status: OrderStatus, message: str) -> None:
         """Setzt einen Fehler-Status."""
         self.status = status
@@ -1,5 +1,6 @@
 """Datenmodelle für Preisberechnung und Bindungen."""
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, Field, computed_field
@@ -34,6 +35,9 @@ class BindingSize(BaseModel):
     def supports_pages(self, pages: int) -> bool:
         """Prüft ob diese Bindungsgröße für die Seitenzahl passt."""
         return self.min_pages <= pages <= self.max_pages
+    
+    class Config:
+        frozen = True  # Stammt aus der Konfiguration und wird nur gelesen
 
 
 class PriceCalculation(BaseModel):
@@ -51,19 +55,19 @@ class PriceCalculation(BaseModel):
     )
     
     @computed_field
-    @property
+    @cached_property
     def pages_price(self) -> float:
         """Berechnet den Preis für die Seiten."""
         return round(self.pages * self.price_per_page, 2)
     
     @computed_field
-    @property
+    @cached_property
     def total_price(self) -> float:
         """Berechnet den Gesamtpreis."""
         return round(self.pages_price + self.binding_price, 2)
     
     @computed_field
-    @property
+    @cached_property
     def price_after_deposit(self) -> float:
         """Preis nach Abzug der 1€ Anzahlung."""
         return round(max(0, self.total_price - 1.0), 2)
@@ -72,22 +76,26 @@ class PriceCalculation(BaseModel):
         """Formatiert einen Preis als String."""
         return f"{price:.2f} €".replace(".", ",")
     
-    @property
+    # Formatierte Preise werden pro (geteilter) Instanz nur einmal erzeugt
+    @cached_property
     def total_price_formatted(self) -> str:
         """Formatierter Gesamtpreis."""
         return self.format_price(self.total_price)
     
-    @property
+    @cached_property
     def pages_price_formatted(self) -> str:
         """Formatierter Seitenpreis."""
         return self.format_price(self.pages_price)
     
-    @property
+    @cached_property
     def binding_price_formatted(self) -> str:
         """Formatierter Bindungspreis."""
         return self.format_price(self.binding_price)
     
-    @property
+    @cached_property
     def price_after_deposit_formatted(self) -> str:
         """Formatierter Preis nach Anzahlung."""
         return self.format_price(self.price_after_deposit)
+    
+    class Config:
+        frozen = True  # Wird vom PricingService gecacht und zwischen Aufträgen geteilt
@@ -1,4 +1,5 @@
 """Verarbeitungs-Pipeline für Druckaufträge."""
+import io
 import os
 import shutil
 import tempfile
@@ -74,39 +75,65 @@ class OrderPipeline:
         organize_files: bool = True,
         print_orders: bool = False,
     ) -> List[Order]:
-        # Temporäres Arbeitsverzeichnis für Deckblätter und Merge
+        # Temporäres Arbeitsverzeichnis für die zusammengefügten PDFs
+        # (Deckblätter entstehen nur im Speicher)
         work_dir = Path(tempfile.mkdtemp(prefix="skriptendruck_"))
         logger.info(f"Arbeitsverzeichnis: {work_dir}")
         
-        if settings.parallel_processing and len(orders) > 1:
-            processed = self._process_parallel(orders, work_dir)
-        else:
-            processed = self._process_sequential(orders, work_dir)
+        try:
+            # Benutzer vorab gesammelt auflösen (eine LDAP-Abfrage statt einer pro Auftrag)
+            self._prefetch_users(orders)
         
-        # Dateien in Ordnerstruktur organisieren
+            if settings.parallel_processing and len(orders) > 1:
+                processed = self._process_parallel(orders, work_dir)
+            else:
+                processed = self._process_sequential(orders, work_dir)
+        
+            # Dateien in Ordnerstruktur organisieren
        
-        if organize_files:
-            self._organize_files(processed)
-        else:
-            logger.warning("=== ORGANIZE ÜBERSPRUNGEN (no_organize flag) ===")
+            if organize_files:
+                self._organize_files(processed)
+            else:
+                logger.warning("=== ORGANIZE ÜBERSPRUNGEN (no_organize flag) ===")
         
-        # In Datenbank speichern
-        if save_to_db:
-            self._save_to_database(processed)
-        # Drucken
-        if print_orders:
-            for order in processed:
-                if order.status == OrderStatus.PROCESSED:
-                    self.printing_service.print_order(order)
-                    order.status = OrderStatus.PRINTED
-                    if organize_files:
-                     self.file_organizer.move_to_printed(order)
+            # In Datenbank speichern
+            if save_to_db:
+                self._save_to_database(processed)
+            # Drucken
+            if print_orders:
+                for order in processed:
+                    if order.status == OrderStatus.PROCESSED:
+                        self.printing_service.print_order(order)
+                        order.status = OrderStatus.PRINTED
+                        if organize_files:
+                         self.file_organizer.move_to_printed(order)
 
-        # Temp-Verzeichnis aufräumen
-        self._cleanup_work_dir(work_dir)
-        
+            # Temp-Verzeichnis aufräumen
+            self._cleanup_work_dir(work_dir)
 
-        return processed
+            return processed
+        finally:
+            # LDAP-Verbindung und persistenten User-Cache (SQLite) schließen;
+            # beim nächsten Lauf werden beide bei Bedarf neu geöffnet
+            self.user_service.close()
+
+    def _prefetch_users(self, orders: List[Order]) -> None:
+        """Lädt die Benutzer aller Aufträge mit einer Sammelabfrage in den Cache."""
+        usernames = []
+        for order in orders:
+            try:
+                username = self.filename_parser.parse(order.filename).username
+            except Exception:
+                continue
+            if username:
+                usernames.append(username)
+        if not usernames:
+            return
+        try:
+            self.user_service.get_users(usernames)
+        except Exception as e:
+            # Nicht kritisch: get_user fragt dann pro Auftrag einzeln
+            logger.warning(f"Benutzer-Vorabfrage fehlgeschlagen: {e}")
 
     def _organize_files(self, processed: List[Order]) -> None:
         """Organisiert verarbeitete Dateien in die Ordnerstruktur."""
@@ -202,7 +229,6 @@ class OrderPipeline:
 
     def _process_parallel(self, orders: List[Order], output_dir: Path) -> List[Order]:
         logger.info(f"Verarbeite {len(orders)} Aufträge parallel (max {settings.max_workers} Worker)")
-        processed = []
         with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
             futures = {
                 executor.submit(self.process_single_order, order, output_dir): order
@@ -212,12 +238,11 @@ class OrderPipeline:
                 order = futures[future]
                 try:
                     future.result()
-                    processed.append(order)
                 except Exception as e:
                     logger.error(f"Fehler bei Order {order.order_id}: {e}")
                     order.set_error(OrderStatus.ERROR_UNKNOWN, str(e))
-                    processed.append(order)
-        return processed
+        # Eingabereihenfolge beibehalten (Zusammenfassung, Datenbank, Excel)
+        return list(orders)
     
     def process_single_order(self, order: Order, output_dir: Path) -> None:
         logger.info(f"Verarbeite Order #{order.order_id}: {order.filename}")
@@ -229,10 +254,11 @@ class OrderPipeline:
             self._analyze_pdf(order)
         if order.is_valid:
             self._calculate_price(order)
+        coversheet = None
         if order.is_valid:
-            self._create_coversheet(order, output_dir)
+            coversheet = self._create_coversheet(order)
         if order.is_valid:
-            self._merge_documents(order, output_dir)
+            self._merge_documents(order, coversheet, output_dir)
         
         if order.is_valid:
             order.status = OrderStatus.PROCESSED
@@ -315,24 +341,27 @@ class OrderPipeline:
             logger.error(f"Fehler bei Preisberechnung: {e}")
             order.set_error(OrderStatus.ERROR_UNKNOWN, str(e))
     
-    def _create_coversheet(self, order: Order, output_dir: Path) -> None:
+    def _create_coversheet(self, order: Order) -> Optional[io.BytesIO]:
+        # Deckblatt bleibt im Speicher und geht direkt in den Merge
         try:
-            coversheet_path = output_dir / f"{order.order_id:04d}_coversheet.pdf"
-            if self.pdf_service.create_coversheet(order, coversheet_path):
-                order.coversheet_path = coversheet_path
-            else:
+            coversheet = self.pdf_service.create_coversheet(order)
+            if coversheet is None:
                 order.set_error(OrderStatus.ERROR_UNKNOWN, "Deckblatt konnte nicht erstellt werden")
+            return coversheet
         except Exception as e:
             logger.error(f"Fehler beim Erstellen des Deckblatts: {e}")
             order.set_error(OrderStatus.ERROR_UNKNOWN, str(e))
+            return None
     
-    def _merge_documents(self, order: Order, output_dir: Path) -> None:
+    def _merge_documents(
+        self, order: Order, coversheet: Optional[io.BytesIO], output_dir: Path
+    ) -> None:
         try:
-            if not order.coversheet_path:
+            if coversheet is None:
                 raise ValueError("Kein Deckblatt vorhanden")
-            merged_path = output_dir / f"{order.order_id:04d}_{order.filename}"
+            merged_path = output_dir / order.target_name
             if self.pdf_service.merge_pdfs(
-                coversheet_path=order.coversheet_path,
+                coversheet=coversheet,
                 document_path=order.filepath,
                 output_path=merged_path,
                     add_empty_page=True,
@@ -4,7 +4,9 @@ Verwaltet die Ordnerstruktur analog zum Original-MATLAB-System (moveDocs.m),
 verschiebt verarbeitete PDFs in die richtigen Zielordner und erstellt
 Backups der Originaldateien.
 """
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +16,15 @@ from ..models import ColorMode, Order, OrderStatus
 
 logger = get_logger("file_organizer")
 
+def _stat_file(path: Optional[Path]) -> Optional[os.stat_result]:
+    """Liefert das stat-Ergebnis einer Datei oder None, falls sie nicht existiert."""
+    if not path:
+        return None
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 class FileOrganizer:
     """
@@ -56,10 +67,32 @@ class FileOrganizer:
         OrderStatus.ERROR_INVALID_FILENAME: "sonstige",
         OrderStatus.ERROR_UNKNOWN: "sonstige",
     }
+    # Einmalig bei Klassendefinition aufgelöst; Unterordner ohne Duplikate ("sonstige")
+    _ERROR_SUBDIRS = tuple(ERROR_DIRS.items())
+    _ERROR_SUBDIR_NAMES = tuple(dict.fromkeys(ERROR_DIRS.values()))
+
+    # Maximale Anzahl gleichzeitig organisierter Aufträge (Netzlaufwerk-Latenz überbrücken)
+    MAX_CONCURRENT_ORDERS = 16
 
     def __init__(self, base_path: Optional[Path] = None) -> None:
         self.base_path = base_path or settings.base_path
-        logger.info(f"FileOrganizer base_path: {self.base_path}")
+        logger.info("FileOrganizer base_path: %s", self.base_path)
+
+        # Fehler-Ordner einmalig vorberechnen statt bei jedem Aufruf neu zusammenzusetzen
+        errors_dir = self.base_path / self.DIR_ERRORS
+        self._error_dir_map = {
+            status: errors_dir / subdir for status, subdir in self._ERROR_SUBDIRS
+        }
+        self._error_dir_default = errors_dir / "sonstige"
+
+        # String-Pfade für die Dateioperationen im Hot Path (os.path statt pathlib)
+        self._print_dir_strs = {
+            mode: os.fspath(self.get_print_dir(mode)) for mode in ColorMode
+        }
+        self._error_dir_strs = {
+            status: os.fspath(path) for status, path in self._error_dir_map.items()
+        }
+        self._error_dir_default_str = os.fspath(self._error_dir_default)
 
     def ensure_directory_structure(self) -> None:
         """Erstellt die komplette Ordnerstruktur."""
@@ -70,11 +103,12 @@ class FileOrganizer:
             self.get_print_dir(ColorMode.COLOR),
             self.get_print_dir(ColorMode.COLOR) / self.DIR_PRINTED,
             self.get_originals_dir(),
-            *(self.get_error_dir(status) for status in self.ERROR_DIRS),
+            *(self.base_path / self.DIR_ERRORS / name for name in self._ERROR_SUBDIR_NAMES),
             self.get_manual_dir(),
         ]
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Parallel anlegen: auf Netzlaufwerken kostet jedes mkdir einen Roundtrip
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            list(executor.map(lambda d: d.mkdir(parents=True, exist_ok=True), directories))
         logger.info("Ordnerstruktur verifiziert")
 
     def get_input_dir(self) -> Path:
@@ -93,156 +127,178 @@ class FileOrganizer:
         return self.get_originals_dir() / batch_name
 
     def get_error_dir(self, status: OrderStatus) -> Path:
-        subdir = self.ERROR_DIRS.get(status, "sonstige")
-        return self.base_path / self.DIR_ERRORS / subdir
+        return self._error_dir_map.get(status, self._error_dir_default)
 
     def get_manual_dir(self) -> Path:
         return self.base_path / self.DIR_MANUAL
 
-    def move_successful_order(self, order: Order) -> Optional[Path]:
-        """Verschiebt ein erfolgreich verarbeitetes PDF nach 02_Druckfertig/."""
+    def move_successful_order(
+        self, order: Order, merged_stat: Optional[os.stat_result] = None
+    ) -> Optional[Path]:
+        """
+        Verschiebt ein erfolgreich verarbeitetes PDF nach 02_Druckfertig/.
+
+        Args:
+            order: Auftrag
+            merged_stat: Bereits ermitteltes stat() des merged PDFs (spart Syscalls)
+        """
         if not order.merged_pdf_path:
-            logger.error(f"Order #{order.order_id}: merged_pdf_path ist None")
+            logger.error("Order #%s: merged_pdf_path ist None", order.order_id)
             return None
 
-        if not order.merged_pdf_path.exists():
+        merged_src = os.fspath(order.merged_pdf_path)
+        merged_stat = merged_stat or _stat_file(order.merged_pdf_path)
+        if merged_stat is None:
             logger.error(
-                f"Order #{order.order_id}: merged PDF nicht gefunden: "
-                f"{order.merged_pdf_path}"
+                "Order #%s: merged PDF nicht gefunden: %s",
+                order.order_id, order.merged_pdf_path,
             )
             return None
 
         try:
             color_mode = order.color_mode or ColorMode.BLACK_WHITE
-            target_dir = self.get_print_dir(color_mode)
-            target_dir.mkdir(parents=True, exist_ok=True)
-            target_name = f"{order.order_id:04d}_{order.filename}"
-            target_path = target_dir / target_name
+            target_dir = self._print_dir_strs[color_mode]
+            os.makedirs(target_dir, exist_ok=True)
+            target_path = os.path.join(target_dir, order.target_name)
 
             logger.debug(
-                f"Verschiebe Order #{order.order_id}: "
-                f"{order.merged_pdf_path} → {target_path}"
+                "Verschiebe Order #%s: %s → %s",
+                order.order_id, order.merged_pdf_path, target_path,
             )
 
             # Kopieren statt move - sicherer bei Cross-Device (temp → Netzlaufwerk)
-            shutil.copy2(str(order.merged_pdf_path), str(target_path))
+            shutil.copy2(merged_src, target_path)
 
-            # Prüfen ob Kopie erfolgreich
-            if target_path.exists():
+            # Prüfen ob Kopie erfolgreich (Größe statt bloßer Existenz)
+            if os.path.getsize(target_path) == merged_stat.st_size:
                 # Original im temp löschen
                 try:
-                    order.merged_pdf_path.unlink()
+                    os.unlink(merged_src)
                 except Exception:
                     pass  # Nicht kritisch
-                logger.debug(f"Order #{order.order_id} → {target_path}")
-                return target_path
+                logger.debug("Order #%s → %s", order.order_id, target_path)
+                return Path(target_path)
             else:
-                logger.error(f"Order #{order.order_id}: Kopie fehlgeschlagen!")
+                logger.error("Order #%s: Kopie fehlgeschlagen!", order.order_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"Fehler beim Verschieben von Order #{order.order_id}: {e}")
+            logger.error("Fehler beim Verschieben von Order #%s: %s", order.order_id, e)
             return None
 
-    def move_failed_order(self, order: Order) -> Optional[Path]:
+    def move_failed_order(
+        self, order: Order, src_stat: Optional[os.stat_result] = None
+    ) -> Optional[Path]:
         """Kopiert ein fehlerhaftes PDF nach 04_Fehler/."""
-        if not order.filepath or not order.filepath.exists():
-            logger.warning(f"Order #{order.order_id}: Quelldatei nicht mehr vorhanden")
+        if (src_stat or _stat_file(order.filepath)) is None:
+            logger.warning("Order #%s: Quelldatei nicht mehr vorhanden", order.order_id)
             return None
         try:
-            target_dir = self.get_error_dir(order.status)
-            target_dir.mkdir(parents=True, exist_ok=True)
-            target_name = f"{order.order_id:04d}_{order.filename}"
-            target_path = target_dir / target_name
-            shutil.copy2(str(order.filepath), str(target_path))
-            logger.info(f"Order #{order.order_id} (Fehler) → {target_path}")
-            return target_path
+            target_dir = self._error_dir_strs.get(order.status, self._error_dir_default_str)
+            os.makedirs(target_dir, exist_ok=True)
+            target_path = os.path.join(target_dir, order.target_name)
+            shutil.copy2(os.fspath(order.filepath), target_path)
+            logger.info("Order #%s (Fehler) → %s", order.order_id, target_path)
+            return Path(target_path)
         except Exception as e:
-            logger.error(f"Fehler beim Kopieren von Order #{order.order_id}: {e}")
+            logger.error("Fehler beim Kopieren von Order #%s: %s", order.order_id, e)
             return None
 
-    def backup_original(self, order: Order, batch_dir: Path) -> Optional[Path]:
+    def backup_original(
+        self, order: Order, batch_dir: Path, src_stat: Optional[os.stat_result] = None
+    ) -> Optional[Path]:
         """Erstellt ein Backup der Originaldatei in 03_Originale/."""
-        if not order.filepath or not order.filepath.exists():
-            logger.warning(f"Order #{order.order_id}: Original nicht gefunden: {order.filepath}")
+        if (src_stat or _stat_file(order.filepath)) is None:
+            logger.warning("Order #%s: Original nicht gefunden: %s", order.order_id, order.filepath)
             return None
         try:
-            batch_dir.mkdir(parents=True, exist_ok=True)
-            target_path = batch_dir / order.filename
-            shutil.copy2(str(order.filepath), str(target_path))
-            logger.debug(f"Backup: {order.filename} → {batch_dir.name}/")
-            return target_path
+            batch_dir_str = os.fspath(batch_dir)
+            os.makedirs(batch_dir_str, exist_ok=True)
+            target_path = os.path.join(batch_dir_str, order.filename)
+            shutil.copy2(os.fspath(order.filepath), target_path)
+            logger.debug("Backup: %s → %s/", order.filename, batch_dir.name)
+            return Path(target_path)
         except Exception as e:
-            logger.error(f"Fehler beim Backup von {order.filename}: {e}")
+            logger.error("Fehler beim Backup von %s: %s", order.filename, e)
             return None
 
     def cleanup_input(self, order: Order) -> bool:
         """Löscht die Originaldatei aus 01_Auftraege/."""
-        if not order.filepath or not order.filepath.exists():
+        if not order.filepath:
             return True
         try:
-            order.filepath.unlink()
-            logger.debug(f"Eingabedatei entfernt: {order.filename}")
+            os.unlink(order.filepath)
+            logger.debug("Eingabedatei entfernt: %s", order.filename)
+            return True
+        except FileNotFoundError:
             return True
         except Exception as e:
-            logger.error(f"Fehler beim Entfernen von {order.filename}: {e}")
+            logger.error("Fehler beim Entfernen von %s: %s", order.filename, e)
             return False
 
     def organize_order(self, order: Order, batch_dir: Path) -> None:
         """Organisiert einen einzelnen Auftrag."""
         logger.info(
-            f"Organisiere Order #{order.order_id}: status={order.status.value}, "
-            f"merged_pdf={order.merged_pdf_path}"
+            "Organisiere Order #%s: status=%s, merged_pdf=%s",
+            order.order_id, order.status.value, order.merged_pdf_path,
         )
 
+        # Einmal stat() pro Datei, an die Einzelschritte weitergereicht
+        src_stat = _stat_file(order.filepath)
+
         # 1. Backup des Originals
-        self.backup_original(order, batch_dir)
+        self.backup_original(order, batch_dir, src_stat)
 
         # 2. Verschieben je nach Status
         if order.status == OrderStatus.PROCESSED:
-            new_path = self.move_successful_order(order)
+            new_path = self.move_successful_order(order, _stat_file(order.merged_pdf_path))
             if new_path:
                 order.merged_pdf_path = new_path
-                logger.debug(f"Order #{order.order_id}: erfolgreich nach {new_path}")
+                logger.debug("Order #%s: erfolgreich nach %s", order.order_id, new_path)
             else:
-                logger.error(f"Order #{order.order_id}: Verschieben fehlgeschlagen!")
+                logger.error("Order #%s: Verschieben fehlgeschlagen!", order.order_id)
         elif order.is_error:
-            self.move_failed_order(order)
+            self.move_failed_order(order, src_stat)
 
         # 3. Original aus Auftraege löschen
         self.cleanup_input(order)
 
+    def _organize_order_safe(self, order: Order, batch_dir: Path) -> None:
+        """Organisiert einen Auftrag; Fehler werden protokolliert statt weitergereicht."""
+        try:
+            self.organize_order(order, batch_dir)
+        except Exception as e:
+            logger.error("Fehler beim Organisieren von Order #%s: %s", order.order_id, e)
+
     def organize_batch(self, orders: List[Order]) -> None:
         """Organisiert eine Batch von Aufträgen in die Ordnerstruktur."""
         if not orders:
             return
 
-        logger.debug(f"organize_batch: {len(orders)} Aufträge, base_path={self.base_path}")
+        logger.debug("organize_batch: %d Aufträge, base_path=%s", len(orders), self.base_path)
         
         self.ensure_directory_structure()
         batch_dir = self.get_originals_batch_dir()
-        logger.info(f"Backup-Verzeichnis: {batch_dir}")
+        logger.info("Backup-Verzeichnis: %s", batch_dir)
         
-        for order in orders:
-            try:
-                self.organize_order(order, batch_dir)
-            except Exception as e:
-                logger.error(f"Fehler beim Organisieren von Order #{order.order_id}: {e}")
-
-        # Deckblatt-Einzeldateien aufräumen
-        for order in orders:
-            if order.coversheet_path and order.coversheet_path.exists():
-                try:
-                    order.coversheet_path.unlink()
-                except Exception:
-                    pass
+        if settings.parallel_processing and len(orders) > 1:
+            # Blockierende Dateioperationen mehrerer Aufträge überlappen (Netzlaufwerk-Latenz)
+            workers = min(self.MAX_CONCURRENT_ORDERS, len(orders))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda order: self._organize_order_safe(order, batch_dir), orders))
+        else:
+            for order in orders:
+                self._organize_order_safe(order, batch_dir)
 
-        logger.debug(f"Batch organisiert: {len(orders)} Aufträge")
+        logger.debug("Batch organisiert: %d Aufträge", len(orders))
 
     def move_to_printed(self, order: Order) -> Optional[Path]:
         """Verschiebt ein gedrucktes PDF in den gedruckt/-Unterordner."""
         if not order.merged_pdf_path or not order.merged_pdf_path.exists():
-            logger.error(f"Order #{order.order_id}: merged_pdf_path nicht gefunden: {order.merged_pdf_path}")
+            logger.error(
+                "Order #%s: merged_pdf_path nicht gefunden: %s",
+                order.order_id, order.merged_pdf_path,
+            )
             return None
         try:
             target_dir = order.merged_pdf_path.parent / self.DIR_PRINTED
@@ -250,8 +306,8 @@ class FileOrganizer:
             target_path = target_dir / order.merged_pdf_path.name
             shutil.move(str(order.merged_pdf_path), str(target_path))
             order.merged_pdf_path = target_path
-            logger.info(f"Order #{order.order_id} gedruckt → {target_path}")
+            logger.info("Order #%s gedruckt → %s", order.order_id, target_path)
             return target_path
         except Exception as e:
-            logger.error(f"Fehler beim Verschieben von Order #{order.order_id}: {e}")
+            logger.error("Fehler beim Verschieben von Order #%s: %s", order.order_id, e)
             return None
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Service zum Parsen von Dateinamen."""
 import re
-from typing import Optional, Tuple
+from typing import List, NamedTuple, Optional
 
 from ..config import get_logger
 from ..models import BindingType, ColorMode
@@ -8,6 +8,16 @@ from ..models import BindingType, ColorMode
 logger = get_logger("filename_parser")
 
 
+class ParseResult(NamedTuple):
+    """Ergebnis von FilenameParser.parse (weiterhin als Tuple entpackbar)."""
+    
+    username: Optional[str]  # RZ-Kennung
+    name: Optional[str]  # Name statt RZ-Kennung
+    color_mode: Optional[ColorMode]
+    binding_type: Optional[BindingType]
+    sequence_number: Optional[int]
+
+
 class FilenameParser:
     """Parst Dateinamen nach dem Schema: username_colormode_bindingtype_number.pdf"""
     
@@ -60,14 +70,34 @@ class FilenameParser:
         # Compile regex patterns für Performance
         self._rz_pattern = re.compile(r"^([a-z]{3}\d{5})", re.IGNORECASE)
         self._number_pattern = re.compile(r"_(\d{3})\.pdf$", re.IGNORECASE)
+        # Je Kategorie eine Alternation statt einer Substring-Suche pro Variante
+        self._sw_re = self._compile_alternation(self.SW_PATTERNS)
+        self._color_re = self._compile_alternation(self.COLOR_PATTERNS)
+        self._folder_re = self._compile_alternation(self.FOLDER_PATTERNS)
+        # Mit/ohne Bindung in einem Muster: der am weitesten links stehende
+        # (bei gleicher Position der längste) Treffer entscheidet, sodass
+        # "ohnebindung" nicht als "bindung" erkannt wird
+        self._binding_types = {
+            **{p: BindingType.SMALL for p in self.WITH_BINDING_PATTERNS},
+            **{p: BindingType.NONE for p in self.WITHOUT_BINDING_PATTERNS},
+        }
+        self._binding_re = self._compile_alternation(list(self._binding_types))
+    
+    @staticmethod
+    def _compile_alternation(patterns: List[str]) -> "re.Pattern[str]":
+        """
+        Kompiliert Varianten zu einer Regex-Alternation (längste zuerst).
+        
+        Args:
+            patterns: Schreibvarianten (kleingeschrieben)
+            
+        Returns:
+            Kompiliertes Muster
+        """
+        ordered = sorted(patterns, key=len, reverse=True)
+        return re.compile("|".join(re.escape(p) for p in ordered))
     
-    def parse(self, filename: str) -> Tuple[
-        Optional[str],  # username/rz-kennung
-        Optional[str],  # parsed_name
-        Optional[ColorMode],  # color_mode
-        Optional[BindingType],  # binding_type
-        Optional[int],  # sequence_number
-    ]:
+    def parse(self, filename: str) -> ParseResult:
         """
         Parst einen Dateinamen.
         
@@ -75,7 +105,7 @@ class FilenameParser:
             filename: Dateiname (z.B. "mus43225_sw_mb_001.pdf")
             
         Returns:
-            Tuple mit (username, name, color_mode, binding_type, sequence_number)
+            ParseResult mit (username, name, color_mode, binding_type, sequence_number)
         """
         logger.debug(f"Parsing filename: {filename}")
         
@@ -113,7 +143,7 @@ class FilenameParser:
             f"color={color_mode}, binding={binding_type}, seq={sequence_number}"
         )
         
-        return username, parsed_name, color_mode, binding_type, sequence_number
+        return ParseResult(username, parsed_name, color_mode, binding_type, sequence_number)
     
     def _extract_username(self, first_part: str) -> Optional[str]:
         """
@@ -162,14 +192,12 @@ class FilenameParser:
         text_lower = text.lower()
         
         # Schwarz-Weiß prüfen
-        for pattern in self.SW_PATTERNS:
-            if pattern in text_lower:
-                return ColorMode.BLACK_WHITE
+        if self._sw_re.search(text_lower):
+            return ColorMode.BLACK_WHITE
         
         # Farbe prüfen
-        for pattern in self.COLOR_PATTERNS:
-            if pattern in text_lower:
-                return ColorMode.COLOR
+        if self._color_re.search(text_lower):
+            return ColorMode.COLOR
         
         # Default: Schwarz-Weiß
         return ColorMode.BLACK_WHITE
@@ -187,20 +215,13 @@ class FilenameParser:
         text_lower = text.lower()
         
         # Schnellhefter prüfen (hat Priorität)
-        for pattern in self.FOLDER_PATTERNS:
-            if pattern in text_lower:
-                return BindingType.FOLDER
-        
-        # Mit Bindung prüfen
-        for pattern in self.WITH_BINDING_PATTERNS:
-            if pattern in text_lower:
-                # Größe wird später durch Seitenzahl bestimmt
-                return BindingType.SMALL  # Default, wird später angepasst
-        
-        # Ohne Bindung prüfen
-        for pattern in self.WITHOUT_BINDING_PATTERNS:
-            if pattern in text_lower:
-                return BindingType.NONE
+        if self._folder_re.search(text_lower):
+            return BindingType.FOLDER
+        
+        # Mit/ohne Bindung prüfen (SMALL: Größe wird später durch Seitenzahl bestimmt)
+        match = self._binding_re.search(text_lower)
+        if match:
+            return self._binding_types[match.group(0)]
         
         # Default: Mit Bindung (wie im Original)
         return BindingType.SMALL
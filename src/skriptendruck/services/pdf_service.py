@@ -1,13 +1,15 @@
 """Service für PDF-Verarbeitung mit pypdf."""
 import io
-import tempfile
+import os
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple, Union
 
 from pypdf import PdfReader, PdfWriter
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 
 from ..config import get_logger
@@ -15,10 +17,96 @@ from ..models import Order
 
 logger = get_logger("pdf_service")
 
+try:
+    import fitz  # PyMuPDF, für Thumbnails; Import lädt libmupdf (einmalig beim Start)
+
+    _HAS_FITZ = True
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    fitz = None
+    _HAS_FITZ = False
+
+try:
+    import pikepdf  # Optional: nativer Merge über libqpdf
+
+    _HAS_PIKEPDF = True
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    pikepdf = None
+    _HAS_PIKEPDF = False
+
+# Schriftmetriken einmalig beim Import laden statt beim ersten Deckblatt
+for _font_name in ("Helvetica", "Helvetica-Bold"):
+    pdfmetrics.getFont(_font_name)
+
+
+def _write_file(output_path: Path, data: Union[bytes, memoryview]) -> None:
+    """
+    Schreibt eine Datei mit einem einzigen write() und atomarem Umbenennen.
+
+    pypdf schreibt Objekt für Objekt in vielen kleinen Stücken; gepuffert im
+    Speicher geht stattdessen ein großer Block auf das (Netz-)Laufwerk. Über
+    die temporäre .part-Datei bleibt bei einem Abbruch kein halbes PDF liegen.
+    """
+    tmp_path = output_path.with_name(output_path.name + ".part")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _count_pages(reader: PdfReader) -> int:
+    """
+    Liest die Seitenzahl aus /Root/Pages/Count.
+
+    Vermeidet das Auflösen des kompletten Seitenbaums; fällt bei defekten
+    oder unplausiblen Einträgen auf len(reader.pages) zurück.
+    """
+    try:
+        count = reader.trailer["/Root"]["/Pages"]["/Count"]
+        if isinstance(count, int) and count >= 0:
+            return int(count)
+    except Exception:
+        pass
+    return len(reader.pages)
+
 
 class PdfService:
     """Service für PDF-Verarbeitung."""
     
+    # Anzeigebreite des Thumbnails auf dem Deckblatt (Punkte)
+    THUMBNAIL_WIDTH_PT = 220
+    
+    def __init__(self) -> None:
+        """Initialisiert den PdfService."""
+        # Reader des aktuell bearbeiteten Dokuments, je Worker-Thread (siehe _get_reader)
+        self._readers = threading.local()
+    
+    def _get_reader(self, pdf_path: Path) -> PdfReader:
+        """
+        Liefert den PdfReader für das Dokument des aktuellen Auftrags.
+        
+        get_page_count und merge_pdfs desselben Auftrags laufen im selben
+        Thread; das Dokument wird so nur einmal geparst. Pro Thread bleibt
+        höchstens ein Reader im Speicher, merge_pdfs gibt ihn wieder frei.
+        mtime und Größe sind Teil des Schlüssels, sodass eine geänderte Datei
+        neu eingelesen wird. Die Datei wird mit einem einzigen read() geladen,
+        statt viele kleine Seeks auf dem (Netz-)Laufwerk auszulösen.
+        """
+        stat = pdf_path.stat()
+        key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        cached = getattr(self._readers, "entry", None)
+        if cached and cached[0] == key:
+            return cached[1]
+        reader = PdfReader(io.BytesIO(pdf_path.read_bytes()))
+        self._readers.entry = (key, reader)
+        return reader
+    
+    def _release_reader(self) -> None:
+        """Gibt den Reader des aktuellen Threads frei."""
+        self._readers.entry = None
+    
     def get_page_count(self, pdf_path: Path) -> Tuple[Optional[int], bool]:
         """
         Ermittelt die Seitenzahl eines PDFs.
@@ -30,14 +118,14 @@ class PdfService:
             Tuple (page_count, is_password_protected)
         """
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             
             # Passwortschutz prüfen
             if reader.is_encrypted:
                 logger.warning(f"PDF ist passwortgeschützt: {pdf_path}")
                 return None, True
             
-            page_count = len(reader.pages)
+            page_count = _count_pages(reader)
             logger.debug(f"PDF hat {page_count} Seiten: {pdf_path}")
             return page_count, False
             
@@ -45,45 +133,41 @@ class PdfService:
             logger.error(f"Fehler beim Lesen des PDFs {pdf_path}: {e}")
             return None, False
     
-    def _render_page_thumbnail(self, pdf_path: Path, page_index: int = 0) -> Optional[str]:
+    def _render_page_thumbnail(self, pdf_path: Path, page_index: int = 0) -> Optional[io.BytesIO]:
         """
-        Rendert eine einzelne PDF-Seite als Bild-Datei (PNG) für die Thumbnail-Vorschau.
+        Rendert eine einzelne PDF-Seite als JPEG für die Thumbnail-Vorschau.
+        
+        Die Auflösung richtet sich nach der Anzeigebreite auf dem Deckblatt
+        (doppelte Pixeldichte), das Bild bleibt komplett im Speicher.
         
         Args:
             pdf_path: Pfad zur PDF-Datei
             page_index: Seitenindex (0 = erste Seite)
             
         Returns:
-            Pfad zur temporären PNG-Datei oder None
+            JPEG-Daten als BytesIO oder None
         """
+        if not _HAS_FITZ:
+            logger.debug("PyMuPDF (fitz) nicht verfügbar – Thumbnail wird übersprungen")
+            return None
+        
         try:
-            import fitz  # PyMuPDF
-            
             doc = fitz.open(str(pdf_path))
-            if len(doc) == 0:
+            try:
+                if len(doc) == 0:
+                    return None
+                
+                page = doc[page_index]
+                
+                zoom = self.THUMBNAIL_WIDTH_PT * 2 / page.rect.width
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                buf = io.BytesIO(pix.tobytes("jpeg", jpg_quality=80))
+            finally:
                 doc.close()
-                return None
-            
-            page = doc[page_index]
-            
-            # Render mit 1.5x Zoom für gute Qualität bei Thumbnail-Größe
-            mat = fitz.Matrix(1.5, 1.5)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Temporäre PNG-Datei erstellen
-            # Windows: Datei muss geschlossen sein bevor pix.save() schreibt
-            tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-            tmp_path = tmp.name
-            tmp.close()
             
-            pix.save(tmp_path)
-            doc.close()
-            logger.debug(f"Thumbnail erstellt: {tmp_path}")
-            return tmp_path
+            logger.debug(f"Thumbnail erstellt: {pix.width}x{pix.height} px")
+            return buf
             
-        except ImportError:
-            logger.debug("PyMuPDF (fitz) nicht verfügbar – Thumbnail wird übersprungen")
-            return None
         except Exception as e:
             logger.warning(f"Thumbnail-Rendering fehlgeschlagen: {e}")
             return None
@@ -91,37 +175,46 @@ class PdfService:
     def create_coversheet(
         self,
         order: Order,
-        output_path: Path,
-    ) -> bool:
+        output_path: Optional[Path] = None,
+    ) -> Optional[io.BytesIO]:
         """
         Erstellt ein Deckblatt für einen Auftrag.
         Layout: Name groß oben, Auftragsdaten links, Thumbnail rechts.
         
+        Das Deckblatt wird im Speicher erzeugt und kann direkt an merge_pdfs
+        übergeben werden; auf die Platte geschrieben wird es nur, wenn
+        output_path angegeben ist.
+        
         Args:
             order: Auftrags-Objekt
-            output_path: Pfad für das Deckblatt
+            output_path: Optionaler Pfad, unter dem das Deckblatt gespeichert wird
             
         Returns:
-            True bei Erfolg
+            PDF-Daten des Deckblatts (Position 0) oder None bei Fehler
         """
-        thumbnail_path = None
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Thumbnail der ersten Seite des ORIGINAL-Dokuments rendern
-            if order.filepath and order.filepath.exists():
-                thumbnail_path = self._render_page_thumbnail(order.filepath)
-            
-            # Canvas erstellen
-            c = canvas.Canvas(str(output_path), pagesize=A4)
+            # Canvas im Speicher erstellen
+            result = io.BytesIO()
+            # Startschrift = Schrift der Kopfzeile. initialFontSize wird von ReportLab
+            # in der Präambel ignoriert (fest 12 pt), daher bleibt das erste setFont.
+            c = canvas.Canvas(result, pagesize=A4, initialFontName="Helvetica")
             width, height = A4
             margin = 50
             right_margin = width - margin
             
+            # setFont nur ausgeben, wenn sich Schrift oder Größe wirklich ändern
+            canvas_font: Optional[Tuple[str, float]] = None
+            
+            def set_font(name: str, size: float) -> None:
+                nonlocal canvas_font
+                if canvas_font != (name, size):
+                    canvas_font = (name, size)
+                    c.setFont(name, size)
+            
             # ============================================================
             # HEADER: Fachschaft-Zeile
             # ============================================================
-            c.setFont("Helvetica", 10)
+            set_font("Helvetica", 10)
             c.setFillColorRGB(0.4, 0.4, 0.4)
             c.drawString(margin, height - 40, "Fachschaft Maschinenbau \u2013 Skriptendruck")
             c.setFillColorRGB(0, 0, 0)
@@ -139,13 +232,13 @@ class PdfService:
             else:
                 name_text = "Unbekannt"
             
-            c.setFont("Helvetica-Bold", 24)
+            set_font("Helvetica-Bold", 24)
             c.drawString(margin, y, name_text)
             y -= 22
             
             # RZ-Kennung und Fakultät unter dem Namen
             if order.user:
-                c.setFont("Helvetica", 11)
+                set_font("Helvetica", 11)
                 c.setFillColorRGB(0.3, 0.3, 0.3)
                 parts = [f"RZ-Kennung: {order.user.username}"]
                 if order.user.faculty:
@@ -171,12 +264,12 @@ class PdfService:
             label_x = margin
             value_x = margin + 120
             
+            # Felder werden gesammelt und später in einem TextObject ausgegeben
+            fields: List[Tuple[float, str, str, bool]] = []
+            
             def draw_field(label: str, value: str, bold_value: bool = False) -> None:
                 nonlocal y
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(label_x, y, label)
-                c.setFont("Helvetica-Bold" if bold_value else "Helvetica", 10)
-                c.drawString(value_x, y, value)
+                fields.append((y, label, value, bold_value))
                 y -= line_height
             
             draw_field("Auftrags-ID:", f"#{order.order_id}")
@@ -212,23 +305,47 @@ class PdfService:
                 
                 # Restbetrag groß – das ist was bei der Ausgabe verlangt wird
                 y -= 4
-                c.setFont("Helvetica-Bold", 10)
+                set_font("Helvetica-Bold", 10)
                 c.drawString(label_x, y, "Zu zahlen:")
-                c.setFont("Helvetica-Bold", 18)
+                set_font("Helvetica-Bold", 18)
                 c.drawString(value_x, y, calc.price_after_deposit_formatted)
                 y -= 14
-                c.setFont("Helvetica", 9)
+                set_font("Helvetica", 9)
                 c.setFillColorRGB(0.4, 0.4, 0.4)
                 c.drawString(value_x, y, "(abzgl. 1,00 \u20ac Anzahlung)")
                 c.setFillColorRGB(0, 0, 0)
                 y -= line_height
             
+            # Alle gesammelten Felder in einem einzigen Text-Block zeichnen
+            text = c.beginText()
+            current_font = None
+            for field_y, label, value, bold_value in fields:
+                if current_font != "Helvetica-Bold":
+                    current_font = "Helvetica-Bold"
+                    text.setFont(current_font, 10)
+                text.setTextOrigin(label_x, field_y)
+                text.textOut(label)
+                value_font = "Helvetica-Bold" if bold_value else "Helvetica"
+                if current_font != value_font:
+                    current_font = value_font
+                    text.setFont(current_font, 10)
+                text.setTextOrigin(value_x, field_y)
+                text.textOut(value)
+            c.drawText(text)
+            canvas_font = None  # TextObject hat die Schrift im PDF-Stream geändert
+            
             # ============================================================
             # THUMBNAIL: Rechte Spalte – Vorschau erste Dokumentseite
             # ============================================================
-            if thumbnail_path:
+            # Vorschau der ersten Seite des ORIGINAL-Dokuments; läuft im Worker-Thread
+            # des Auftrags, die Pipeline parallelisiert bereits über die Aufträge
+            thumbnail = None
+            if order.filepath and order.filepath.exists():
+                thumbnail = self._render_page_thumbnail(order.filepath)
+            
+            if thumbnail:
                 try:
-                    img = ImageReader(thumbnail_path)
+                    img = ImageReader(thumbnail)
                     img_w, img_h = img.getSize()
                     
                     # Maximal so breit wie die rechte Spalte, Höhe proportional
@@ -243,7 +360,7 @@ class PdfService:
                     thumb_y = info_top_y - thumb_h
                     
                     # Label
-                    c.setFont("Helvetica", 8)
+                    set_font("Helvetica", 8)
                     c.setFillColorRGB(0.4, 0.4, 0.4)
                     c.drawString(thumb_x, info_top_y + 4, "Vorschau:")
                     c.setFillColorRGB(0, 0, 0)
@@ -255,7 +372,7 @@ class PdfService:
                     
                     # Bild
                     c.drawImage(
-                        thumbnail_path,
+                        img,
                         thumb_x, thumb_y,
                         width=thumb_w, height=thumb_h,
                         preserveAspectRatio=True,
@@ -270,10 +387,10 @@ class PdfService:
             if order.status.value == "error_invalid_filename":
                 y -= 10
                 c.setFillColorRGB(0.8, 0, 0)
-                c.setFont("Helvetica-Bold", 10)
+                set_font("Helvetica-Bold", 10)
                 c.drawString(label_x, y, "ACHTUNG: Dateiname nicht korrekt!")
                 y -= line_height
-                c.setFont("Helvetica", 9)
+                set_font("Helvetica", 9)
                 c.drawString(label_x, y, "Bitte n\u00e4chstes Mal richtig benennen:")
                 y -= line_height
                 c.drawString(label_x, y, "RZ-Kennung_sw/farbig_mb/ob/sh_001.pdf")
@@ -283,30 +400,29 @@ class PdfService:
             # FOOTER
             # ============================================================
             c.setFillColorRGB(0.5, 0.5, 0.5)
-            c.setFont("Helvetica", 8)
+            set_font("Helvetica", 8)
             c.drawString(margin, 30, "Fachschaft Maschinenbau \u2013 Hochschule Regensburg")
             c.drawRightString(right_margin, 30, f"Auftrag #{order.order_id}")
             c.setFillColorRGB(0, 0, 0)
             
             c.save()
+            result.seek(0)
             
-            logger.info(f"Deckblatt erstellt: {output_path}")
-            return True
+            if output_path:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                _write_file(output_path, result.getvalue())
+                logger.info(f"Deckblatt erstellt: {output_path}")
+            else:
+                logger.debug(f"Deckblatt erstellt für Order #{order.order_id}")
+            return result
             
         except Exception as e:
             logger.error(f"Fehler beim Erstellen des Deckblatts: {e}")
-            return False
-        finally:
-            # Temporäre Thumbnail-Datei aufräumen
-            if thumbnail_path:
-                try:
-                    Path(thumbnail_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
+            return None
     
     def merge_pdfs(
         self,
-        coversheet_path: Path,
+        coversheet: Union[Path, BinaryIO],
         document_path: Path,
         output_path: Path,
         add_empty_page: bool = False,
@@ -315,7 +431,7 @@ class PdfService:
         Fügt Deckblatt und Dokument zusammen.
         
         Args:
-            coversheet_path: Pfad zum Deckblatt
+            coversheet: Pfad zum Deckblatt oder Deckblatt-Daten im Speicher
             document_path: Pfad zum Dokument
             output_path: Pfad für die Ausgabedatei
             add_empty_page: Leere Seite zwischen Deckblatt und Dokument einfügen
@@ -326,25 +442,34 @@ class PdfService:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
+            if _HAS_PIKEPDF:
+                try:
+                    self._merge_pdfs_native(
+                        coversheet, document_path, output_path, add_empty_page
+                    )
+                    logger.info(f"PDFs zusammengefügt: {output_path}")
+                    return True
+                except Exception as e:
+                    logger.debug(f"pikepdf-Merge fehlgeschlagen, nutze pypdf: {e}")
+                    if not isinstance(coversheet, Path):
+                        coversheet.seek(0)
+            
             writer = PdfWriter()
             
-            # Deckblatt hinzufügen
-            coversheet_reader = PdfReader(coversheet_path)
-            for page in coversheet_reader.pages:
-                writer.add_page(page)
+            # Deckblatt hinzufügen (append übernimmt alle Seiten in einem Schritt)
+            writer.append(coversheet)
             
             # Optional: Leere Seite
             if add_empty_page:
                 writer.add_blank_page(width=A4[0], height=A4[1])
             
-            # Dokument hinzufügen
-            document_reader = PdfReader(document_path)
-            for page in document_reader.pages:
-                writer.add_page(page)
+            # Dokument hinzufügen (Reader aus get_page_count wiederverwenden)
+            writer.append(self._get_reader(document_path))
             
-            # Speichern
-            with open(output_path, "wb") as f:
-                writer.write(f)
+            # Im Speicher serialisieren und in einem Block schreiben
+            buf = io.BytesIO()
+            writer.write(buf)
+            _write_file(output_path, buf.getbuffer())
             
             logger.info(f"PDFs zusammengefügt: {output_path}")
             return True
@@ -352,3 +477,36 @@ class PdfService:
         except Exception as e:
             logger.error(f"Fehler beim Zusammenfügen der PDFs: {e}")
             return False
+        finally:
+            # Merge ist der letzte Schritt des Auftrags, der das Dokument liest
+            self._release_reader()
+    
+    def _merge_pdfs_native(
+        self,
+        coversheet: Union[Path, BinaryIO],
+        document_path: Path,
+        output_path: Path,
+        add_empty_page: bool,
+    ) -> None:
+        """
+        Fügt die PDFs mit pikepdf (libqpdf) zusammen.
+        
+        Seiten werden in C++ kopiert und direkt geschrieben, ohne jedes Objekt
+        über Python zu serialisieren. Fehler werden an den Aufrufer
+        weitergereicht, der dann auf pypdf zurückfällt.
+        """
+        with pikepdf.Pdf.open(coversheet) as cover, \
+                pikepdf.Pdf.open(document_path) as document, \
+                pikepdf.Pdf.new() as out:
+            out.pages.extend(cover.pages)
+            if add_empty_page:
+                out.add_blank_page(page_size=A4)
+            out.pages.extend(document.pages)
+            # Wie _write_file: über eine .part-Datei, damit kein halbes PDF liegen bleibt
+            tmp_path = output_path.with_name(output_path.name + ".part")
+            try:
+                out.save(tmp_path)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
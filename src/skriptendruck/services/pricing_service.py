@@ -1,7 +1,8 @@
 """Service für Preisberechnung und Bindungsgrößen."""
 import json
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..config import get_logger, settings
 from ..models import BindingSize, BindingType, ColorMode, PriceCalculation
@@ -15,6 +16,9 @@ class PricingService:
     def __init__(self) -> None:
         """Initialisiert den PricingService."""
         self._binding_sizes: List[BindingSize] = []
+        self._min_pages: List[int] = []
+        # Memo für calculate_price; Preise aus settings sind Teil des Keys
+        self._price_cache: Dict[Tuple, PriceCalculation] = {}
         self._load_binding_sizes()
     
     def calculate_price(
@@ -32,8 +36,28 @@ class PricingService:
             binding_type: Bindungstyp
             
         Returns:
-            PriceCalculation-Objekt
+            PriceCalculation-Objekt (unveränderlich, kann geteilt werden)
         """
+        key = (
+            pages, color_mode, binding_type,
+            settings.price_sw, settings.price_color,
+            settings.price_binding_small, settings.price_binding_large, settings.price_folder,
+        )
+        cached = self._price_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        calc = self._calculate_price_uncached(pages, color_mode, binding_type)
+        self._price_cache[key] = calc
+        return calc
+    
+    def _calculate_price_uncached(
+        self,
+        pages: int,
+        color_mode: ColorMode,
+        binding_type: BindingType,
+    ) -> PriceCalculation:
+        """Führt die eigentliche Preisberechnung ohne Cache durch."""
         # Seitenpreis ermitteln
         price_per_page = (
             settings.price_color if color_mode == ColorMode.COLOR
@@ -84,9 +108,10 @@ class PricingService:
         Returns:
             BindingSize oder None wenn keine passende Größe gefunden
         """
-        for binding_size in self._binding_sizes:
-            if binding_size.supports_pages(pages):
-                return binding_size
+        # Binäre Suche über die nach min_pages sortierte Tabelle
+        idx = bisect_right(self._min_pages, pages) - 1
+        if idx >= 0 and pages <= self._binding_sizes[idx].max_pages:
+            return self._binding_sizes[idx]
         return None
     
     def validate_page_count(self, pages: int, binding_type: BindingType) -> tuple[bool, Optional[str]]:
@@ -122,15 +147,18 @@ class PricingService:
             return
         
         try:
-            with open(binding_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # json.loads erkennt UTF-8 in bytes selbst; ein read() statt Stream-Parsing
+            data = json.loads(binding_file.read_bytes())
             
+            # Validierung bleibt bewusst aktiv: wandelt binding_type in das Enum um
+            # und lässt fehlerhafte Einträge auf die Default-Tabelle zurückfallen
             self._binding_sizes = [
-                BindingSize(**item) for item in data.get("binding_sizes", [])
+                BindingSize.model_validate(item) for item in data.get("binding_sizes", [])
             ]
             
             # Sortieren nach min_pages
             self._binding_sizes.sort(key=lambda x: x.min_pages)
+            self._build_lookup()
             
             logger.info(f"Loaded {len(self._binding_sizes)} binding sizes")
             
@@ -155,8 +183,27 @@ class PricingService:
                 binding_type=BindingType.LARGE
             ),
         ]
+        self._build_lookup()
         logger.info("Using default binding sizes")
     
+    def _build_lookup(self) -> None:
+        """
+        Baut den Suchindex (sortierte min_pages) für die Bindungstabelle auf.
+        
+        Raises:
+            ValueError: Wenn sich Bereiche überschneiden oder nicht aufsteigend
+                sortiert sind (die binäre Suche würde sonst falsche Größen liefern)
+        """
+        for prev, cur in zip(self._binding_sizes, self._binding_sizes[1:]):
+            if cur.min_pages <= prev.max_pages:
+                raise ValueError(
+                    f"Bindungsgrößen überschneiden sich: "
+                    f"{prev.min_pages}-{prev.max_pages} und {cur.min_pages}-{cur.max_pages} Seiten"
+                )
+        self._min_pages = [b.min_pages for b in self._binding_sizes]
+        # Neue Bindungstabelle → gecachte Preise ungültig
+        self._price_cache.clear()
+    
     def export_default_binding_sizes_json(self, output_path: Path) -> None:
         """
         Exportiert eine Beispiel-JSON-Datei für Ringbindungsgrößen.
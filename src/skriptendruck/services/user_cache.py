@@ -0,0 +1,135 @@
+"""Persistenter SQLite-Cache für per LDAP gefundene Benutzer."""
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+from ..config import get_logger
+from ..models import User
+
+logger = get_logger("user_cache")
+
+
+class UserCache:
+    """
+    Persistenter Cache für LDAP-Benutzerdaten.
+
+    Übersteht Neustarts des Programms, sodass bekannte Benutzer ohne
+    LDAP-Roundtrip aufgelöst werden. Einträge verfallen nach ttl_seconds.
+    Der Blacklist-Status wird bewusst nicht gespeichert, sondern beim
+    Lesen vom UserService gesetzt.
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: int) -> None:
+        """
+        Öffnet (bzw. erstellt) die Cache-Datenbank.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            ttl_seconds: Gültigkeit eines Eintrags in Sekunden
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit + WAL: Lesen blockiert nicht durch parallele Schreibzugriffe
+        self._conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "username TEXT PRIMARY KEY, first_name TEXT, last_name TEXT, "
+            "faculty TEXT, email TEXT, fetched_at REAL)"
+        )
+        # Bekannte Benutzernamen im Speicher: Fehltreffer kosten keine SQL-Abfrage
+        self._known: Set[str] = {
+            row[0] for row in self._conn.execute("SELECT username FROM users")
+        }
+        logger.debug(f"User-Cache geöffnet: {db_path}")
+
+    def get(self, username: str) -> Optional[User]:
+        """
+        Liefert einen noch gültigen Benutzer aus dem Cache.
+
+        Args:
+            username: RZ-Kennung (kleingeschrieben)
+
+        Returns:
+            User-Objekt oder None bei Fehltreffer/abgelaufenem Eintrag
+        """
+        if username not in self._known:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT username, first_name, last_name, faculty, email FROM users "
+                    "WHERE username = ? AND fetched_at > ?",
+                    (username, time.time() - self.ttl_seconds),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"User-Cache nicht lesbar: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        return User(
+            username=row[0],
+            first_name=row[1],
+            last_name=row[2],
+            faculty=sys.intern(row[3]),
+            email=row[4],
+        )
+
+    def put(self, user: User) -> None:
+        """Speichert bzw. aktualisiert einen Benutzer im Cache."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO users "
+                    "(username, first_name, last_name, faculty, email, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        user.username,
+                        user.first_name,
+                        user.last_name,
+                        user.faculty,
+                        user.email,
+                        time.time(),
+                    ),
+                )
+                self._known.add(user.username)
+        except sqlite3.Error as e:
+            logger.warning(f"User-Cache nicht beschreibbar: {e}")
+
+    def invalidate(self, username: str) -> bool:
+        """
+        Entfernt einen Benutzer aus dem Cache.
+
+        Returns:
+            True wenn ein Eintrag gelöscht wurde
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM users WHERE username = ?", (username,))
+            self._known.discard(username)
+        return cursor.rowcount > 0
+
+    def invalidate_all(self) -> int:
+        """
+        Leert den kompletten Cache.
+
+        Returns:
+            Anzahl gelöschter Einträge
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM users")
+            self._known.clear()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Schließt die Datenbankverbindung."""
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,59 @@
 """Service für Benutzerverwaltung mit LDAP und CSV-Fallback."""
-import csv
+import re
+import ssl
+import sys
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..config import get_logger, settings
 from ..models import User
+from .user_cache import UserCache
 
 logger = get_logger("user_service")
 
+try:
+    from ldap3 import NONE, RESTARTABLE, SUBTREE, Connection, Server, Tls
+    from ldap3.core.exceptions import LDAPCommunicationError
+    from ldap3.utils.conv import escape_filter_chars
+
+    _LDAP3_AVAILABLE = True
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    _LDAP3_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _lower(username: str) -> str:
+    """
+    Normalisiert eine RZ-Kennung auf Kleinbuchstaben.
+
+    Dieselben Kennungen tauchen über viele Aufträge hinweg auf; gecacht und
+    interniert entsteht pro Kennung nur ein String-Objekt.
+    """
+    return sys.intern(username.lower())
+
+
+# Mapping von Fakultätsnamen zu Codes
+_FACULTY_MAP = {
+    "maschinenbau": "M",
+    "elektrotechnik": "E",
+    "informatik": "I",
+    "bauingenieurwesen": "B",
+    "architektur": "A",
+    "betriebswirtschaft": "BW",
+    # Weitere Fakultäten hinzufügen
+}
+# Ein Suchlauf über alle Schlüssel statt einer Substring-Suche pro Fakultät.
+# Enthält der Text mehrere Fakultätsnamen, gewinnt der zuerst vorkommende.
+_FACULTY_RE = re.compile("|".join(re.escape(key) for key in _FACULTY_MAP), re.IGNORECASE)
+# Filter sucht nach samAccountName = Kennung; nur dann lassen sich Treffer einer
+# Sammelabfrage sicher über entry.samAccountName zuordnen
+_SAM_FILTER_RE = re.compile(r"samAccountName=\{0\}", re.IGNORECASE)
+# Großbuchstaben für Latin-1-Zeichen vorberechnet (Default-Code bei unbekannter Fakultät)
+_UPPER_FIRST = [sys.intern(c.upper()) for c in map(chr, range(256))]
+
 
 class UserService:
     """
@@ -15,11 +61,45 @@ class UserService:
     Unterstützt LDAP-Abfragen und CSV-Fallback.
     """
     
+    # Attribute die wir aus dem LDAP benötigen
+    LDAP_ATTRIBUTES = [
+        "givenName",      # Vorname
+        "sn",             # Nachname (surname)
+        "mail",           # E-Mail
+        "department",     # Abteilung/Fakultät
+        "samAccountName", # Username
+    ]
+    # Maximale Anzahl Benutzer pro OR-Filter (AD begrenzt die Filtergröße)
+    LDAP_BATCH_SIZE = 500
+    # Serverseitiges Zeitlimit pro Suche in Sekunden
+    LDAP_TIME_LIMIT = 5
+    # Wie lange ein "nicht gefunden" gemerkt wird (Sekunden) und wie viele davon.
+    # Treffer landen in _users_cache bzw. im persistenten Cache.
+    LDAP_MISS_TTL = 60
+    LDAP_MISS_CACHE_SIZE = 1024
+    
     def __init__(self) -> None:
         """Initialisiert den UserService."""
         self._users_cache: Dict[str, User] = {}
+        # Sekundärindex (vorname, nachname) in Kleinbuchstaben -> User
+        self._name_index: Dict[Tuple[str, str], User] = {}
         self._blacklist: Set[str] = set()
         self._csv_loaded = False
+        # Persistenter LDAP-Cache, wird beim ersten LDAP-Zugriff geöffnet
+        self._persistent_cache: Optional[UserCache] = None
+        self._persistent_cache_disabled = False
+        # Wiederverwendete LDAP-Verbindung (siehe _get_ldap_conn)
+        self._ldap_server: Optional[Any] = None
+        self._ldap_conn: Optional[Any] = None
+        self._ldap_lock = threading.Lock()
+        # Benutzer ohne LDAP-Treffer: username -> gültig bis (time.monotonic)
+        self._ldap_misses: Dict[str, float] = {}
+        # Eigener Lock: Eintragen/Verdrängen aus mehreren Worker-Threads, ohne
+        # auf eine laufende LDAP-Suche (_ldap_lock) zu warten
+        self._misses_lock = threading.Lock()
+        # Aufbereiteter Search-Filter (siehe _get_filter_template)
+        self._filter_source: Optional[str] = None
+        self._filter_template = ""
         
         # Blacklist laden
         self._load_blacklist()
@@ -39,29 +119,85 @@ class UserService:
         Returns:
             User-Objekt oder None wenn nicht gefunden
         """
-        username = username.lower()
+        username = _lower(username)
         
         # Cache prüfen
-        if username in self._users_cache:
+        user = self._users_cache.get(username)
+        if user:
             logger.debug(f"User {username} from cache")
-            return self._users_cache[username]
+            return self._refresh_blocked(user)
         
-        # LDAP Abfrage versuchen
+        # Persistenter Cache, danach LDAP Abfrage
         if settings.ldap_enabled:
-            user = self._query_ldap(username)
+            persistent_cache = self._get_persistent_cache()
+            user = persistent_cache.get(username) if persistent_cache else None
             if user:
-                # Blacklist prüfen
-                user.is_blocked = username in self._blacklist
-                self._users_cache[username] = user
+                logger.debug(f"User {username} from persistent cache")
+            else:
+                user = self._query_ldap(username)
+                if user and persistent_cache:
+                    persistent_cache.put(user)
+            if user:
+                self._cache_user(user)
                 return user
         
         # CSV Fallback
-        if username in self._users_cache:
-            return self._users_cache[username]
+        user = self._users_cache.get(username)
+        if user:
+            return self._refresh_blocked(user)
         
         logger.warning(f"User {username} not found")
         return None
     
+    def get_users(self, usernames: Iterable[str]) -> Dict[str, User]:
+        """
+        Sucht mehrere Benutzer auf einmal.
+        
+        Nicht gecachte Benutzer werden mit einer einzigen LDAP-Suche pro
+        LDAP_BATCH_SIZE Benutzer geholt (OR-Filter) statt einzeln abgefragt.
+        
+        Args:
+            usernames: RZ-Kennungen
+            
+        Returns:
+            Dict RZ-Kennung (kleingeschrieben) -> User für alle gefundenen Benutzer
+        """
+        found: Dict[str, User] = {}
+        missing: List[str] = []
+        for username in dict.fromkeys(_lower(u) for u in usernames):
+            user = self._users_cache.get(username)
+            if user:
+                found[username] = self._refresh_blocked(user)
+            else:
+                missing.append(username)
+        
+        if not missing or not settings.ldap_enabled:
+            return found
+        
+        # Persistenter Cache
+        persistent_cache = self._get_persistent_cache()
+        if persistent_cache:
+            still_missing = []
+            for username in missing:
+                user = persistent_cache.get(username)
+                if user:
+                    self._cache_user(user)
+                    found[username] = user
+                else:
+                    still_missing.append(username)
+            missing = still_missing
+        
+        # Rest per LDAP in Blöcken abfragen
+        for i in range(0, len(missing), self.LDAP_BATCH_SIZE):
+            for user in self._query_ldap_many(missing[i:i + self.LDAP_BATCH_SIZE]):
+                self._cache_user(user)
+                if persistent_cache:
+                    persistent_cache.put(user)
+                found[user.username] = user
+        
+        logger.debug(f"get_users: {len(found)} gefunden, {len(missing)} per LDAP angefragt")
+        return found
+    
     def get_user_by_name(self, first_name: str, last_name: str) -> Optional[User]:
         """
         Sucht einen Benutzer anhand des Namens.
@@ -73,14 +209,9 @@ class UserService:
         Returns:
             User-Objekt oder None wenn nicht gefunden
         """
-        first_name = first_name.lower()
-        last_name = last_name.lower()
-        
-        # Durchsuche Cache
-        for user in self._users_cache.values():
-            if (user.first_name.lower() == first_name and 
-                user.last_name.lower() == last_name):
-                return user
+        user = self._name_index.get((first_name.lower(), last_name.lower()))
+        if user:
+            return self._refresh_blocked(user)
         
         # Bei LDAP: erweiterte Suche möglich
         if settings.ldap_enabled:
@@ -89,6 +220,69 @@ class UserService:
         
         return None
 
+    def invalidate_user(self, username: str) -> None:
+        """
+        Entfernt einen Benutzer aus allen Caches (Speicher und persistent).
+        
+        Args:
+            username: RZ-Kennung
+        """
+        username = _lower(username)
+        with self._misses_lock:
+            self._ldap_misses.pop(username, None)
+        user = self._users_cache.pop(username, None)
+        if user:
+            key = (user.first_name.lower(), user.last_name.lower())
+            if self._name_index.get(key) is user:
+                del self._name_index[key]
+        
+        persistent_cache = self._get_persistent_cache()
+        if persistent_cache:
+            persistent_cache.invalidate(username)
+    
+    def invalidate_all(self) -> None:
+        """Leert alle Benutzer-Caches (Speicher und persistent)."""
+        self._users_cache.clear()
+        self._name_index.clear()
+        with self._misses_lock:
+            self._ldap_misses.clear()
+        
+        persistent_cache = self._get_persistent_cache()
+        if persistent_cache:
+            persistent_cache.invalidate_all()
+        
+        # CSV-Fallback neu laden, sonst wären diese Benutzer verloren
+        if self._csv_loaded:
+            self._load_users_from_csv()
+    
+    def _get_persistent_cache(self) -> Optional[UserCache]:
+        """Öffnet den persistenten LDAP-Cache beim ersten Zugriff."""
+        if self._persistent_cache is None and not self._persistent_cache_disabled:
+            try:
+                if settings.user_cache_path:
+                    self._persistent_cache = UserCache(
+                        Path(settings.user_cache_path),
+                        int(settings.user_cache_ttl_seconds),
+                    )
+                else:
+                    self._persistent_cache_disabled = True
+            except Exception as e:
+                logger.warning(f"Persistenter User-Cache nicht verfügbar: {e}")
+                self._persistent_cache_disabled = True
+        return self._persistent_cache
+    
+    def _cache_user(self, user: User) -> None:
+        """Legt einen Benutzer im Cache und im Namensindex ab."""
+        self._refresh_blocked(user)
+        self._users_cache[user.username] = user
+        # setdefault: bei Namensgleichheit gewinnt wie bisher der zuerst geladene
+        self._name_index.setdefault((user.first_name.lower(), user.last_name.lower()), user)
+
+    def _refresh_blocked(self, user: User) -> User:
+        """Gleicht is_blocked mit der aktuellen Blacklist ab (auch für gecachte Benutzer)."""
+        user.is_blocked = user.username in self._blacklist
+        return user
+
     @staticmethod
     def _ensure_ldap_filter_parens(filter_str: str) -> str:
         """
@@ -106,125 +300,290 @@ class UserService:
             filter_str = f"({filter_str})"
         return filter_str
     
-    def _query_ldap(self, username: str) -> Optional[User]:
+    def _get_filter_template(self) -> str:
         """
-        Führt eine LDAP-Abfrage durch (Windows-kompatibel mit ldap3).
-        Angepasst für HS Regensburg Active Directory.
+        Liefert den Search-Filter als Template mit einem Platzhalter {0}.
+        
+        Klammern werden nur einmal pro konfiguriertem Filter ergänzt statt bei
+        jeder Abfrage; ändert sich settings.ldap_search_filter, wird neu aufbereitet.
         
-        Args:
-            username: RZ-Kennung (z.B. 'abc12345')
-            
         Returns:
-            User-Objekt oder None
+            Filter-Template, z.B. '(samAccountName={0})'
         """
-        try:
-            from ldap3 import Server, Connection, ALL, Tls, SUBTREE
-            import ssl
-            
-            if not settings.ldap_server or not settings.ldap_base_dn:
-                logger.error("LDAP nicht konfiguriert")
-                return None
-            
+        raw = settings.ldap_search_filter
+        if raw != self._filter_source:
+            self._filter_template = self._ensure_ldap_filter_parens(raw).replace("{username}", "{0}")
+            self._filter_source = raw
+        return self._filter_template
+    
+    def _get_ldap_conn(self) -> Any:
+        """
+        Liefert die wiederverwendete LDAP-Verbindung.
+        
+        Server und Connection (inkl. TLS-Handshake und Bind) werden nur beim
+        ersten Aufruf bzw. nach einem Verbindungsabbruch aufgebaut.
+        
+        Returns:
+            Gebundene ldap3-Connection
+        """
+        if self._ldap_conn is not None:
+            return self._ldap_conn
+        
+        if self._ldap_server is None:
             # TLS/SSL Konfiguration für LDAPS
             tls_configuration = None
             if settings.ldap_use_ssl:
                 try:
-                    tls_configuration = Tls(
-                        validate=ssl.CERT_REQUIRED,
-                        version=ssl.PROTOCOL_TLSv1_2,
-                    )
+                    # Ohne version nutzt ldap3 ssl.create_default_context (min. TLS 1.2)
+                    tls_configuration = Tls(validate=ssl.CERT_REQUIRED)
                 except Exception as tls_err:
                     logger.warning(f"TLS strikt fehlgeschlagen: {tls_err}, Fallback CERT_NONE")
                     tls_configuration = Tls(validate=ssl.CERT_NONE)
             
             # LDAP Server initialisieren
-            server = Server(
+            self._ldap_server = Server(
                 settings.ldap_server,
                 port=settings.ldap_port,
                 use_ssl=settings.ldap_use_ssl,
                 tls=tls_configuration,
-                get_info=ALL,
+                # Kein Schema/DSA-Info abrufen: wird nicht ausgewertet und kostet
+                # beim ersten Bind einen zusätzlichen Roundtrip samt Schema-Parsing
+                get_info=NONE,
                 connect_timeout=10,
             )
-
-            # Verbindung aufbauen (ohne SAFE_SYNC – wie im Test-Skript)
-            if settings.ldap_bind_dn and settings.ldap_bind_password:
-                conn = Connection(
-                    server,
-                    user=settings.ldap_bind_dn,
-                    password=settings.ldap_bind_password,
-                    auto_bind=True,
-                    raise_exceptions=True,
+        
+        # Verbindung aufbauen (RESTARTABLE verbindet bei Abbrüchen selbst neu)
+        if settings.ldap_bind_dn and settings.ldap_bind_password:
+            conn = Connection(
+                self._ldap_server,
+                user=settings.ldap_bind_dn,
+                password=settings.ldap_bind_password,
+                auto_bind=True,
+                raise_exceptions=True,
+                client_strategy=RESTARTABLE,
+            )
+        else:
+            conn = Connection(
+                self._ldap_server,
+                auto_bind=True,
+                raise_exceptions=True,
+                client_strategy=RESTARTABLE,
+            )
+        
+        self._ldap_conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Trennt die LDAP-Verbindung und schließt den persistenten Cache."""
+        with self._ldap_lock:
+            if self._ldap_conn is not None:
+                try:
+                    self._ldap_conn.unbind()
+                except Exception as e:
+                    logger.debug(f"LDAP unbind fehlgeschlagen: {e}")
+                self._ldap_conn = None
+        
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
+    
+    def _search_ldap(self, search_filter: str, size_limit: int = 0) -> List[Any]:
+        """
+        Führt eine Suche über die wiederverwendete Verbindung aus.
+        
+        Args:
+            search_filter: Vollständiger LDAP-Filter (mit Klammern)
+            size_limit: Maximale Anzahl Ergebnisse (0 = unbegrenzt)
+            
+        Returns:
+            Liste der gefundenen ldap3-Entries
+        """
+        logger.debug(f"LDAP search: base={settings.ldap_base_dn}, filter={search_filter}")
+        
+        # Die Verbindung wird zwischen Threads geteilt (SYNC ist nicht threadsicher)
+        with self._ldap_lock:
+            try:
+                conn = self._get_ldap_conn()
+                conn.search(
+                    search_base=settings.ldap_base_dn,
+                    search_filter=search_filter,
+                    search_scope=SUBTREE,
+                    attributes=self.LDAP_ATTRIBUTES,
+                    size_limit=size_limit,
+                    time_limit=self.LDAP_TIME_LIMIT,
                 )
-            else:
-                conn = Connection(server, auto_bind=True, raise_exceptions=True)
-
-            # Search-Filter bauen und Klammern sicherstellen
-            raw_filter = settings.ldap_search_filter.format(username=username)
-            search_filter = self._ensure_ldap_filter_parens(raw_filter)
-
-            logger.debug(f"LDAP search: base={settings.ldap_base_dn}, filter={search_filter}")
+            except LDAPCommunicationError as e:
+                # Vom Server getrennt: Verbindung verwerfen und einmal neu versuchen
+                logger.info(f"LDAP-Verbindung verloren ({e}), verbinde neu")
+                self._ldap_conn = None
+                conn = self._get_ldap_conn()
+                conn.search(
+                    search_base=settings.ldap_base_dn,
+                    search_filter=search_filter,
+                    search_scope=SUBTREE,
+                    attributes=self.LDAP_ATTRIBUTES,
+                    size_limit=size_limit,
+                    time_limit=self.LDAP_TIME_LIMIT,
+                )
+            return list(conn.entries)
+    
+    @staticmethod
+    def _entry_value(entry: Any, attribute: str) -> str:
+        """
+        Liest ein LDAP-Attribut als String.
+        
+        Mehrwertige Attribute liefert ldap3 als Liste; dann zählt der erste Wert.
+        
+        Args:
+            entry: ldap3-Entry
+            attribute: Attributname
             
-            # Attribute die wir benötigen
-            attributes = [
-                "givenName",      # Vorname
-                "sn",             # Nachname (surname)
-                "mail",           # E-Mail
-                "department",     # Abteilung/Fakultät
-                "samAccountName", # Username
-            ]
+        Returns:
+            Attributwert oder "" wenn nicht vorhanden/leer
+        """
+        attr = getattr(entry, attribute, None)
+        value = attr.value if attr is not None else None
+        if isinstance(value, list):
+            value = value[0] if value else None
+        return str(value) if value is not None else ""
+    
+    def _user_from_entry(self, entry: Any, username: str) -> User:
+        """
+        Baut ein User-Objekt aus einem LDAP-Entry.
+        
+        Args:
+            entry: ldap3-Entry mit den Attributen aus LDAP_ATTRIBUTES
+            username: RZ-Kennung (kleingeschrieben)
             
-            conn.search(
-                search_base=settings.ldap_base_dn,
-                search_filter=search_filter,
-                search_scope=SUBTREE,
-                attributes=attributes,
-            )
+        Returns:
+            User-Objekt
+        """
+        first_name = self._entry_value(entry, 'givenName')
+        last_name = self._entry_value(entry, 'sn')
+        email = self._entry_value(entry, 'mail')
+        department = self._entry_value(entry, 'department')
+        
+        # Fakultät aus Department extrahieren
+        faculty_code = self._get_faculty_code(department)
+        
+        return User(
+            username=username,
+            first_name=first_name,
+            last_name=last_name,
+            faculty=faculty_code,
+            email=email if email else None,
+        )
+    
+    def _query_ldap(self, username: str) -> Optional[User]:
+        """
+        Führt eine LDAP-Abfrage durch (Windows-kompatibel mit ldap3).
+        Angepasst für HS Regensburg Active Directory.
+        
+        "Nicht gefunden" wird LDAP_MISS_TTL Sekunden gemerkt, Fehler nicht.
+        
+        Args:
+            username: RZ-Kennung (z.B. 'abc12345')
             
-            if conn.entries:
-                entry = conn.entries[0]
-                
-                # Attribute extrahieren (ldap3 gibt direkt Strings zurück)
-                first_name = str(entry.givenName.value) if hasattr(entry, 'givenName') else ""
-                last_name = str(entry.sn.value) if hasattr(entry, 'sn') else ""
-                email = str(entry.mail.value) if hasattr(entry, 'mail') else ""
-                department = str(entry.department.value) if hasattr(entry, 'department') else ""
-                
-                # Bei Listen den ersten Wert nehmen
-                if isinstance(first_name, list):
-                    first_name = first_name[0] if first_name else ""
-                if isinstance(last_name, list):
-                    last_name = last_name[0] if last_name else ""
-                if isinstance(email, list):
-                    email = email[0] if email else ""
-                if isinstance(department, list):
-                    department = department[0] if department else ""
-                
-                # Fakultät aus Department extrahieren
-                faculty_code = self._get_faculty_code(department)
-                
-                user = User(
-                    username=username,
-                    first_name=first_name,
-                    last_name=last_name,
-                    faculty=faculty_code,
-                    email=email if email else None,
-                )
-                
+        Returns:
+            User-Objekt oder None
+        """
+        if not _LDAP3_AVAILABLE:
+            logger.error("ldap3 nicht installiert - bitte 'poetry install' ausführen")
+            return None
+        
+        miss_until = self._ldap_misses.get(username)
+        if miss_until and miss_until > time.monotonic():
+            logger.debug(f"LDAP: {username} kürzlich nicht gefunden, keine neue Abfrage")
+            return None
+        
+        try:
+            if not settings.ldap_server or not settings.ldap_base_dn:
+                logger.error("LDAP nicht konfiguriert")
+                return None
+
+            search_filter = self._get_filter_template().format(escape_filter_chars(username))
+            
+            # Es wird genau ein Eintrag gebraucht
+            entries = self._search_ldap(search_filter, size_limit=1)
+            
+            if entries:
+                user = self._user_from_entry(entries[0], username)
                 logger.info(f"User {username} found via LDAP: {user.full_name}")
-                conn.unbind()
                 return user
 
             logger.info(f"LDAP: Kein Ergebnis für {username}")
-            conn.unbind()
+            self._remember_ldap_miss(username)
             
-        except ImportError:
-            logger.error("ldap3 nicht installiert - bitte 'poetry install' ausführen")
         except Exception as e:
             logger.error(f"LDAP-Fehler für {username}: {e}")
         
         return None
     
+    def _remember_ldap_miss(self, username: str) -> None:
+        """Merkt sich ein "nicht gefunden"; bei vollem Cache fliegt der älteste Eintrag."""
+        with self._misses_lock:
+            self._ldap_misses.pop(username, None)
+            if len(self._ldap_misses) >= self.LDAP_MISS_CACHE_SIZE:
+                del self._ldap_misses[next(iter(self._ldap_misses))]
+            self._ldap_misses[username] = time.monotonic() + self.LDAP_MISS_TTL
+    
+    def _query_ldap_many(self, usernames: List[str]) -> List[User]:
+        """
+        Sucht mehrere Benutzer mit einer einzigen LDAP-Abfrage (OR-Filter).
+        
+        Nicht gefundene Benutzer werden wie bei _query_ldap als Fehltreffer
+        gemerkt, damit ein anschließendes get_user nicht einzeln nachfragt.
+        Das geschieht nur, wenn der Filter auf samAccountName sucht: sonst ist
+        die Zuordnung über entry.samAccountName nicht verlässlich, und get_user
+        fragt die übrigen Benutzer einzeln ab.
+        
+        Args:
+            usernames: RZ-Kennungen (kleingeschrieben)
+            
+        Returns:
+            Liste der gefundenen Benutzer
+        """
+        if not _LDAP3_AVAILABLE:
+            logger.error("ldap3 nicht installiert - bitte 'poetry install' ausführen")
+            return []
+        
+        try:
+            if not settings.ldap_server or not settings.ldap_base_dn:
+                logger.error("LDAP nicht konfiguriert")
+                return []
+            
+            filter_template = self._get_filter_template()
+            search_filter = "(|" + "".join(
+                filter_template.format(escape_filter_chars(u)) for u in usernames
+            ) + ")"
+            
+            wanted = set(usernames)
+            users = []
+            for entry in self._search_ldap(search_filter):
+                if not hasattr(entry, 'samAccountName'):
+                    continue
+                username = _lower(str(entry.samAccountName.value))
+                if username in wanted:
+                    users.append(self._user_from_entry(entry, username))
+                    wanted.discard(username)
+            
+            if _SAM_FILTER_RE.search(filter_template):
+                for username in wanted:
+                    self._remember_ldap_miss(username)
+            elif wanted:
+                logger.debug(
+                    f"LDAP: {len(wanted)} Benutzer ohne samAccountName-Zuordnung, "
+                    "werden bei Bedarf einzeln abgefragt"
+                )
+            
+            logger.info(f"LDAP: {len(users)} von {len(usernames)} Benutzern gefunden")
+            return users
+            
+        except Exception as e:
+            logger.error(f"LDAP-Fehler bei Sammelabfrage: {e}")
+        
+        return []
+    
     def _load_users_from_csv(self) -> None:
         """Lädt Benutzer aus CSV-Datei (Fallback)."""
         csv_path = settings.users_csv_path
@@ -234,29 +593,24 @@ class UserService:
             return
         
         try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                # Format: username firstname lastname faculty
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        username = parts[0].lower()
-                        first_name = parts[1]
-                        last_name = parts[2]
-                        faculty = parts[3]
-                        
-                        user = User(
-                            username=username,
-                            first_name=first_name,
-                            last_name=last_name,
-                            faculty=faculty,
-                            is_blocked=username in self._blacklist,
-                        )
-                        
-                        self._users_cache[username] = user
+            # Format: username firstname lastname faculty (durch Leerzeichen getrennt)
+            lines = csv_path.read_text(encoding="utf-8").splitlines()
+            rows = [
+                line.split()
+                for line in lines
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+            
+            for parts in rows:
+                if len(parts) < 4:
+                    continue
+                username = _lower(parts[0])
+                self._cache_user(User(
+                    username=username,
+                    first_name=parts[1],
+                    last_name=parts[2],
+                    faculty=sys.intern(parts[3]),  # wenige verschiedene Codes
+                ))
             
             logger.info(f"Loaded {len(self._users_cache)} users from CSV")
             self._csv_loaded = True
@@ -273,11 +627,14 @@ class UserService:
             return
         
         try:
-            with open(blacklist_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    username = line.strip().lower()
-                    if username and not username.startswith("#"):
-                        self._blacklist.add(username)
+            # Ein read() und eine Set-Comprehension statt add() pro Zeile; bleibt ein
+            # (veränderbares) set, da Einträge zur Laufzeit ergänzt werden können
+            lines = blacklist_path.read_text(encoding="utf-8").splitlines()
+            self._blacklist = {
+                username
+                for username in (line.strip().lower() for line in lines)
+                if username and not username.startswith("#")
+            }
             
             logger.info(f"Loaded {len(self._blacklist)} blocked users")
             
@@ -294,7 +651,7 @@ class UserService:
         Returns:
             True wenn blockiert
         """
-        return username.lower() in self._blacklist
+        return _lower(username) in self._blacklist
     
     def _get_faculty_code(self, faculty_name: str) -> str:
         """
@@ -306,21 +663,17 @@ class UserService:
         Returns:
             Fakultätscode (z.B. "M")
         """
-        # Mapping von Fakultätsnamen zu Codes
-        faculty_map = {
-            "maschinenbau": "M",
-            "elektrotechnik": "E",
-            "informatik": "I",
-            "bauingenieurwesen": "B",
-            "architektur": "A",
-            "betriebswirtschaft": "BW",
-            # Weitere Fakultäten hinzufügen
-        }
-        
-        faculty_lower = faculty_name.lower()
-        for key, code in faculty_map.items():
-            if key in faculty_lower:
-                return code
+        # Schneller Weg: department enthält genau den Fakultätsnamen
+        code = _FACULTY_MAP.get(faculty_name.lower())
+        if code:
+            return code
+        
+        match = _FACULTY_RE.search(faculty_name)
+        if match:
+            return _FACULTY_MAP[match.group(0).lower()]
         
         # Default: Ersten Buchstaben nehmen
-        return faculty_name[0].upper() if faculty_name else "?"
+        if not faculty_name:
+            return "?"
+        first = ord(faculty_name[0])
+        return _UPPER_FIRST[first] if first < 256 else faculty_name[0].upper()
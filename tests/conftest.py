@@ -0,0 +1,5 @@
+"""Gemeinsame pytest-Konfiguration."""
+
+# Manuelles Diagnoseskript (echter LDAP-Bind, interaktive Eingabe) – kein pytest-Test.
+# Aufruf: python tests/test_ldap.py <rz-kennung> <passwort> [<zu-suchende-kennung>]
+collect_ignore = ["test_ldap.py"]
@@ -168,6 +168,33 @@ class TestFileOrganizer:
         assert organizer.cleanup_input(order)
         assert not input_pdf.exists()
 
+    def test_organize_batch_parallel(self, tmp_path: Path) -> None:
+        """Test: Mehrere Aufträge werden nebenläufig organisiert."""
+        organizer = FileOrganizer(base_path=tmp_path)
+        organizer.ensure_directory_structure()
+
+        orders = []
+        for i in range(1, 4):
+            input_pdf = tmp_path / "01_Auftraege" / f"bad_{i}.pdf"
+            input_pdf.write_text("fake pdf")
+            orders.append(Order(
+                order_id=i,
+                filename=input_pdf.name,
+                filepath=input_pdf,
+                file_size_bytes=100,
+                status=OrderStatus.ERROR_USER_NOT_FOUND,
+            ))
+
+        with patch("skriptendruck.services.file_organizer.settings") as mock_settings:
+            mock_settings.parallel_processing = True
+            organizer.organize_batch(orders)
+
+        error_dir = tmp_path / "04_Fehler" / "benutzer_nicht_gefunden"
+        assert sorted(p.name for p in error_dir.iterdir()) == [
+            "0001_bad_1.pdf", "0002_bad_2.pdf", "0003_bad_3.pdf"
+        ]
+        assert not any((tmp_path / "01_Auftraege").iterdir())
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
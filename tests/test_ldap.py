@@ -8,13 +8,25 @@ Beispiel:
     python test_ldap.py mus43225 meinPasswort mus43225
 
 Ohne Argumente wird interaktiv nach den Daten gefragt.
+Mit LDAP_DIAG=1 werden bei leerem Suchergebnis zusätzliche Diagnose-Suchen
+(Bind-User, Wildcard) ausgeführt.
+Mit LOG_LEVEL=DEBUG werden bei Fehlern vollständige Tracebacks ausgegeben.
+
+Kein pytest-Test: wird über tests/conftest.py von der Testsammlung
+ausgeschlossen, da es eine echte Verbindung zum AD aufbaut.
 """
+import logging
+import os
 import sys
 import ssl
-import traceback
+
+logger = logging.getLogger(__name__)
 
 
 def main() -> None:
+    # Tracebacks nur mit LOG_LEVEL=DEBUG
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), format="%(message)s")
+
     # === Eingabe ===
     if len(sys.argv) >= 4:
         bind_user = sys.argv[1]
@@ -64,8 +76,9 @@ def main() -> None:
     print("[1/5] TLS-Konfiguration...")
     tls_config = None
     try:
-        tls_config = Tls(validate=ssl.CERT_REQUIRED, version=ssl.PROTOCOL_TLSv1_2)
-        print("      OK (CERT_REQUIRED, TLSv1.2)")
+        # Ohne version nutzt ldap3 ssl.create_default_context (min. TLS 1.2)
+        tls_config = Tls(validate=ssl.CERT_REQUIRED)
+        print("      OK (CERT_REQUIRED, Default-Context)")
     except Exception as e:
         print(f"      WARNUNG: Strikt TLS fehlgeschlagen: {e}")
         print("      Fallback auf CERT_NONE (nur zum Testen!)")
@@ -85,7 +98,7 @@ def main() -> None:
         print(f"      OK")
     except Exception as e:
         print(f"      FEHLER: {e}")
-        traceback.print_exc()
+        logger.debug("Traceback:", exc_info=True)
         return
 
     # === Schritt 3: Bind ===
@@ -107,7 +120,7 @@ def main() -> None:
                 print(f"      Naming Contexts: {naming}")
     except Exception as e:
         print(f"      FEHLER: {e}")
-        traceback.print_exc()
+        logger.debug("Traceback:", exc_info=True)
         print()
         print("  Mögliche Ursachen:")
         print("  - Falsches Passwort")
@@ -116,107 +129,116 @@ def main() -> None:
         print("  - Zertifikatsproblem")
         return
 
-    # === Schritt 4: Suche ===
-    print(f"[4/5] Suche: {SEARCH_FILTER} in {LDAP_BASE_DN}...")
+    # Eine gebundene Verbindung für Suche und alle Diagnose-Abfragen;
+    # finally trennt sie auch bei Fehlern und frühem return (unbind).
+    # Kein with-Block: Connection.__exit__ trennt nur Verbindungen, die beim
+    # Betreten noch nicht gebunden waren (hier bereits per auto_bind gebunden).
     try:
-        success = conn.search(
-            search_base=LDAP_BASE_DN,
-            search_filter=SEARCH_FILTER,
-            search_scope=SUBTREE,
-            attributes=ATTRIBUTES,
-        )
-        print(f"      Search success: {success}")
-        print(f"      Result: {conn.result}")
-        print(f"      Anzahl Ergebnisse: {len(conn.entries)}")
-    except Exception as e:
-        print(f"      FEHLER bei Suche: {e}")
-        traceback.print_exc()
-
-        # Retry mit kleinerem Scope
-        print()
-        print("      Versuche alternative Base DNs...")
-        for alt_base in [
-            "CN=Users,dc=hs-regensburg,dc=de",
-            "OU=Users,dc=hs-regensburg,dc=de",
-            "OU=Benutzer,dc=hs-regensburg,dc=de",
-        ]:
-            try:
-                conn.search(
-                    search_base=alt_base,
-                    search_filter=SEARCH_FILTER,
-                    search_scope=SUBTREE,
-                    attributes=["samAccountName"],
-                )
-                print(f"      {alt_base}: {len(conn.entries)} Treffer")
-            except Exception as e2:
-                print(f"      {alt_base}: {e2}")
-        conn.unbind()
-        return
-
-    # === Schritt 5: Ergebnisse ===
-    print(f"[5/5] Ergebnisse:")
-    print()
-    if conn.entries:
-        for i, entry in enumerate(conn.entries):
-            print(f"  --- Eintrag {i+1} ---")
-            print(f"  DN: {entry.entry_dn}")
-            for attr_name in ATTRIBUTES:
-                try:
-                    val = getattr(entry, attr_name, None)
-                    if val is not None:
-                        print(f"  {attr_name}: {val.value}")
-                    else:
-                        print(f"  {attr_name}: (nicht vorhanden)")
-                except Exception:
-                    print(f"  {attr_name}: (Fehler beim Lesen)")
-            print()
-    else:
-        print("  KEINE ERGEBNISSE!")
-        print()
-        print("  Mögliche Ursachen:")
-        print(f"  - RZ-Kennung '{search_user}' existiert nicht")
-        print(f"  - Base DN '{LDAP_BASE_DN}' ist falsch/zu eingeschränkt")
-        print(f"  - Bind-User hat keine Leserechte auf diesen Bereich")
-        print()
-
-        # Diagnostik: Eigenen Bind-User suchen
-        if search_user != bind_user:
-            print(f"  Versuche stattdessen den Bind-User ({bind_user}) zu suchen...")
-            try:
-                conn.search(
-                    search_base=LDAP_BASE_DN,
-                    search_filter=f"(samAccountName={bind_user})",
-                    search_scope=SUBTREE,
-                    attributes=["samAccountName", "distinguishedName"],
-                )
-                if conn.entries:
-                    print(f"  -> Bind-User gefunden: {conn.entries[0].entry_dn}")
-                    print(f"  -> Problem liegt am gesuchten User '{search_user}'")
-                else:
-                    print(f"  -> Auch Bind-User nicht gefunden!")
-                    print(f"  -> Wahrscheinlich falscher Base DN oder fehlende Rechte")
-            except Exception as e:
-                print(f"  -> Fehler: {e}")
-
-        # Diagnostik: Wildcard-Suche
-        print()
-        print("  Versuche Wildcard-Suche (erste 5 User)...")
+        # === Schritt 4: Suche ===
+        print(f"[4/5] Suche: {SEARCH_FILTER} in {LDAP_BASE_DN}...")
         try:
-            conn.search(
+            success = conn.search(
                 search_base=LDAP_BASE_DN,
-                search_filter="(samAccountName=*)",
+                search_filter=SEARCH_FILTER,
                 search_scope=SUBTREE,
-                attributes=["samAccountName"],
-                size_limit=5,
+                attributes=ATTRIBUTES,
             )
-            print(f"  -> {len(conn.entries)} Treffer:")
-            for e in conn.entries:
-                print(f"     {e.samAccountName.value} ({e.entry_dn})")
+            print(f"      Search success: {success}")
+            print(f"      Result: {conn.result}")
+            print(f"      Anzahl Ergebnisse: {len(conn.entries)}")
         except Exception as e:
-            print(f"  -> Fehler: {e}")
-            print(f"  -> Wildcard evtl. nicht erlaubt (normal bei AD)")
+            print(f"      FEHLER bei Suche: {e}")
+            logger.debug("Traceback:", exc_info=True)
+
+            # Retry mit kleinerem Scope
+            print()
+            print("      Versuche alternative Base DNs...")
+            for alt_base in [
+                "CN=Users,dc=hs-regensburg,dc=de",
+                "OU=Users,dc=hs-regensburg,dc=de",
+                "OU=Benutzer,dc=hs-regensburg,dc=de",
+            ]:
+                try:
+                    conn.search(
+                        search_base=alt_base,
+                        search_filter=SEARCH_FILTER,
+                        search_scope=SUBTREE,
+                        attributes=["samAccountName"],
+                    )
+                    print(f"      {alt_base}: {len(conn.entries)} Treffer")
+                except Exception as e2:
+                    print(f"      {alt_base}: {e2}")
+            return
+
+        # === Schritt 5: Ergebnisse ===
+        print(f"[5/5] Ergebnisse:")
+        print()
+        if conn.entries:
+            for i, entry in enumerate(conn.entries):
+                print(f"  --- Eintrag {i+1} ---")
+                print(f"  DN: {entry.entry_dn}")
+                for attr_name in ATTRIBUTES:
+                    try:
+                        val = getattr(entry, attr_name, None)
+                        if val is not None:
+                            print(f"  {attr_name}: {val.value}")
+                        else:
+                            print(f"  {attr_name}: (nicht vorhanden)")
+                    except Exception:
+                        print(f"  {attr_name}: (Fehler beim Lesen)")
+                print()
+        else:
+            print("  KEINE ERGEBNISSE!")
+            print()
+            print("  Mögliche Ursachen:")
+            print(f"  - RZ-Kennung '{search_user}' existiert nicht")
+            print(f"  - Base DN '{LDAP_BASE_DN}' ist falsch/zu eingeschränkt")
+            print(f"  - Bind-User hat keine Leserechte auf diesen Bereich")
+            print()
+
+            # Weitere Suchen (je ein Roundtrip) nur auf Wunsch
+            if not os.getenv("LDAP_DIAG"):
+                print("  Für weitere Diagnose-Suchen LDAP_DIAG=1 setzen.")
+            else:
+                # Diagnostik: Eigenen Bind-User suchen
+                if search_user != bind_user:
+                    print(f"  Versuche stattdessen den Bind-User ({bind_user}) zu suchen...")
+                    try:
+                        conn.search(
+                            search_base=LDAP_BASE_DN,
+                            search_filter=f"(samAccountName={bind_user})",
+                            search_scope=SUBTREE,
+                            attributes=["samAccountName", "distinguishedName"],
+                        )
+                        if conn.entries:
+                            print(f"  -> Bind-User gefunden: {conn.entries[0].entry_dn}")
+                            print(f"  -> Problem liegt am gesuchten User '{search_user}'")
+                        else:
+                            print(f"  -> Auch Bind-User nicht gefunden!")
+                            print(f"  -> Wahrscheinlich falscher Base DN oder fehlende Rechte")
+                    except Exception as e:
+                        print(f"  -> Fehler: {e}")
+
+                # Diagnostik: Wildcard-Suche
+                print()
+                print("  Versuche Wildcard-Suche (erste 5 User)...")
+                try:
+                    conn.search(
+                        search_base=LDAP_BASE_DN,
+                        search_filter="(samAccountName=*)",
+                        search_scope=SUBTREE,
+                        attributes=["samAccountName"],
+                        size_limit=5,
+                    )
+                    print(f"  -> {len(conn.entries)} Treffer:")
+                    for e in conn.entries:
+                        print(f"     {e.samAccountName.value} ({e.entry_dn})")
+                except Exception as e:
+                    print(f"  -> Fehler: {e}")
+                    print(f"  -> Wildcard evtl. nicht erlaubt (normal bei AD)")
+    finally:
+        conn.unbind()
 
-    conn.unbind()
     print()
     print("Fertig.")
 
@@ -0,0 +1,158 @@
+"""Tests für den PdfService."""
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pypdf import PdfReader
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from skriptendruck.models import BindingType, ColorMode, Order, OrderStatus, User
+from skriptendruck.services import PdfService, PricingService
+from skriptendruck.services.pdf_service import _write_file
+
+
+def _create_pdf(path: Path, pages: int) -> Path:
+    """Erzeugt ein einfaches Test-PDF mit der angegebenen Seitenzahl."""
+    c = canvas.Canvas(str(path), pagesize=A4)
+    for i in range(pages):
+        c.drawString(100, 700, f"Seite {i + 1}")
+        c.showPage()
+    c.save()
+    return path
+
+
+class TestPdfService:
+    """Tests für den PdfService."""
+
+    def setup_method(self) -> None:
+        """Setup für jeden Test."""
+        self.service = PdfService()
+
+    def test_create_coversheet(self, tmp_path: Path) -> None:
+        """Test: Deckblatt enthält Name, Auftragsdaten und Preis."""
+        doc = _create_pdf(tmp_path / "mus43225_sw_mb_001.pdf", 10)
+        order = Order(
+            order_id=7,
+            filename=doc.name,
+            filepath=doc,
+            file_size_bytes=doc.stat().st_size,
+            user=User(username="mus43225", first_name="Max", last_name="Muster", faculty="M"),
+            page_count=10,
+            status=OrderStatus.VALIDATED,
+        )
+        order.price_calculation = PricingService().calculate_price(
+            pages=10, color_mode=ColorMode.BLACK_WHITE, binding_type=BindingType.SMALL
+        )
+        output = tmp_path / "cover.pdf"
+
+        assert self.service.create_coversheet(order, output)
+
+        reader = PdfReader(output)
+        assert len(reader.pages) == 1
+        text = reader.pages[0].extract_text()
+        assert "Max Muster" in text
+        assert "Auftrags-ID:" in text
+        assert "#7" in text
+        assert order.price_calculation.total_price_formatted in text
+        # Feste Texte aus Kopf- und Fußzeile
+        assert "Skriptendruck" in text
+        assert "Hochschule Regensburg" in text
+
+    def test_get_page_count(self, tmp_path: Path) -> None:
+        """Test: Seitenzahl wird korrekt ermittelt."""
+        pdf = _create_pdf(tmp_path / "doc.pdf", 3)
+
+        page_count, is_protected = self.service.get_page_count(pdf)
+
+        assert page_count == 3
+        assert is_protected is False
+
+    def test_get_page_count_invalid_file(self, tmp_path: Path) -> None:
+        """Test: Ungültige Datei liefert None."""
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("kein pdf")
+
+        page_count, is_protected = self.service.get_page_count(bad)
+
+        assert page_count is None
+        assert is_protected is False
+
+    def test_merge_pdfs_with_empty_page(self, tmp_path: Path) -> None:
+        """Test: Deckblatt + Leerseite + Dokument werden zusammengefügt."""
+        cover = _create_pdf(tmp_path / "cover.pdf", 1)
+        doc = _create_pdf(tmp_path / "doc.pdf", 4)
+        output = tmp_path / "out" / "merged.pdf"
+
+        assert self.service.merge_pdfs(cover, doc, output, add_empty_page=True)
+
+        pages = PdfReader(output).pages
+        assert len(pages) == 6
+        # Reihenfolge: Deckblatt, Leerseite, Dokument
+        assert pages[1].extract_text() == ""
+        assert "Seite 1" in pages[2].extract_text()
+        assert "Seite 4" in pages[5].extract_text()
+
+    def test_merge_pdfs_with_in_memory_coversheet(self, tmp_path: Path) -> None:
+        """Test: Deckblatt wird ohne Umweg über die Platte zusammengefügt."""
+        doc = _create_pdf(tmp_path / "doc.pdf", 2)
+        order = Order(
+            order_id=3,
+            filename=doc.name,
+            filepath=doc,
+            file_size_bytes=doc.stat().st_size,
+            page_count=2,
+        )
+
+        coversheet = self.service.create_coversheet(order)
+        assert coversheet is not None
+
+        output = tmp_path / "merged.pdf"
+        assert self.service.merge_pdfs(coversheet, doc, output)
+        assert len(PdfReader(output).pages) == 3
+        assert sorted(tmp_path.iterdir()) == sorted([doc, output])
+
+    def test_reader_reused_between_count_and_merge(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test: Das Dokument wird für Seitenzahl und Merge nur einmal geparst."""
+        monkeypatch.setattr("skriptendruck.services.pdf_service._HAS_PIKEPDF", False)
+        cover = _create_pdf(tmp_path / "cover.pdf", 1)
+        doc = _create_pdf(tmp_path / "doc.pdf", 2)
+
+        with patch("skriptendruck.services.pdf_service.PdfReader", wraps=PdfReader) as reader_cls:
+            self.service.get_page_count(doc)
+            self.service.merge_pdfs(cover, doc, tmp_path / "merged.pdf")
+
+        assert reader_cls.call_count == 1
+        # Nach dem Merge hält der Service das Dokument nicht länger im Speicher
+        assert self.service._readers.entry is None
+
+    def test_write_file_failure_removes_part_file(self, tmp_path: Path) -> None:
+        """Test: Schlägt das Schreiben fehl, wird die .part-Datei wieder entfernt."""
+        with pytest.raises(TypeError):
+            _write_file(tmp_path / "merged.pdf", "kein bytes-Objekt")  # type: ignore[arg-type]
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_native_merge_failure_leaves_no_partial_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test: Bricht der pikepdf-Merge beim Speichern ab, bleibt keine halbe Datei liegen."""
+        def broken_save(path: Path) -> None:
+            Path(path).write_bytes(b"%PDF-1.7 abgebrochen")
+            raise OSError("Datenträger voll")
+
+        fake_pikepdf = MagicMock()
+        fake_pikepdf.Pdf.new.return_value.__enter__.return_value.save.side_effect = broken_save
+        monkeypatch.setattr("skriptendruck.services.pdf_service.pikepdf", fake_pikepdf)
+        output = tmp_path / "merged.pdf"
+
+        with pytest.raises(OSError):
+            self.service._merge_pdfs_native(tmp_path / "cover.pdf", tmp_path / "doc.pdf", output, False)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
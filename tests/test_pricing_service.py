@@ -1,16 +1,35 @@
 """Tests für den PricingService."""
 import pytest
 
-from skriptendruck.models import BindingType, ColorMode
+from skriptendruck.models import BindingSize, BindingType, ColorMode
 from skriptendruck.services import PricingService
 
 
+# (Seitenzahl, erwartete Bindungsgröße in mm) je Tabellenbereich
+_BINDING_SIZE_CASES = (
+    (50, 6.9),     # 1-80 Seiten
+    (90, 8.0),     # 81-100
+    (110, 9.5),    # 101-120
+    (140, 11.0),   # 121-150
+    (170, 12.7),   # 151-180
+    (200, 14.3),   # 181-210
+    (230, 16.0),   # 211-240
+    (270, 19.0),   # 241-300
+    (330, 22.0),   # 301-360
+    (400, 25.4),   # 361-420
+    (450, 28.5),   # 421-480
+    (520, 32.0),   # 481-540
+    (600, 38.0),   # 541-660
+)
+
+
 class TestPricingService:
     """Tests für den PricingService."""
     
-    def setup_method(self) -> None:
-        """Setup für jeden Test."""
-        self.service = PricingService()
+    @classmethod
+    def setup_class(cls) -> None:
+        """Setup einmal pro Testklasse (PricingService ist zustandslos)."""
+        cls.service = PricingService()
     
     def test_calculate_price_black_white_no_binding(self) -> None:
         """Test: Preisberechnung Schwarz-Weiß ohne Bindung."""
@@ -20,10 +39,10 @@ class TestPricingService:
             binding_type=BindingType.NONE,
         )
         
-        assert calc.pages == 100
-        assert calc.pages_price == 4.0  # 100 * 0.04
-        assert calc.binding_price == 0.0
-        assert calc.total_price == 4.0
+        # (Seiten, Seitenpreis, Bindungspreis, Gesamt); 100 * 0.04
+        assert (
+            calc.pages, calc.pages_price, calc.binding_price, calc.total_price
+        ) == pytest.approx((100, 4.0, 0.0, 4.0))
     
     def test_calculate_price_color_with_binding(self) -> None:
         """Test: Preisberechnung Farbe mit Bindung."""
@@ -33,10 +52,10 @@ class TestPricingService:
             binding_type=BindingType.SMALL,
         )
         
-        assert calc.pages == 200
-        assert calc.pages_price == 20.0  # 200 * 0.10
-        assert calc.binding_price == 1.0  # Kleine Bindung
-        assert calc.total_price == 21.0
+        # 200 * 0.10 + kleine Bindung
+        assert (
+            calc.pages, calc.pages_price, calc.binding_price, calc.total_price
+        ) == pytest.approx((200, 20.0, 1.0, 21.0))
     
     def test_calculate_price_with_folder(self) -> None:
         """Test: Preisberechnung mit Schnellhefter."""
@@ -46,8 +65,8 @@ class TestPricingService:
             binding_type=BindingType.FOLDER,
         )
         
-        assert calc.binding_price == 0.5  # Schnellhefter
-        assert calc.total_price == 2.5  # 50*0.04 + 0.5
+        # Schnellhefter: 50*0.04 + 0.5
+        assert (calc.binding_price, calc.total_price) == pytest.approx((0.5, 2.5))
     
     def test_price_after_deposit(self) -> None:
         """Test: Preis nach Abzug der Anzahlung."""
@@ -59,8 +78,22 @@ class TestPricingService:
         
         # Total: 4.0 (Seiten) + 1.0 (Bindung) = 5.0
         # Nach Anzahlung: 5.0 - 1.0 = 4.0
-        assert calc.total_price == 5.0
-        assert calc.price_after_deposit == 4.0
+        assert (calc.total_price, calc.price_after_deposit) == pytest.approx((5.0, 4.0))
+    
+    def test_calculate_price_is_cached(self) -> None:
+        """Test: Gleiche Eingaben liefern das gecachte Ergebnis."""
+        first = self.service.calculate_price(
+            pages=120, color_mode=ColorMode.BLACK_WHITE, binding_type=BindingType.SMALL
+        )
+        second = self.service.calculate_price(
+            pages=120, color_mode=ColorMode.BLACK_WHITE, binding_type=BindingType.SMALL
+        )
+        other = self.service.calculate_price(
+            pages=120, color_mode=ColorMode.COLOR, binding_type=BindingType.SMALL
+        )
+        
+        assert first is second
+        assert other is not first
     
     def test_validate_page_count_too_few(self) -> None:
         """Test: Validierung - zu wenig Seiten."""
@@ -111,7 +144,7 @@ class TestPricingService:
         )
         
         assert calc.binding_type == BindingType.LARGE
-        assert calc.binding_price == 1.50
+        assert calc.binding_price == pytest.approx(1.50)
     
     def test_small_binding_at_boundary(self) -> None:
         """Test: Kleine Bindung bei genau 300 Seiten."""
@@ -122,7 +155,7 @@ class TestPricingService:
         )
         
         assert calc.binding_type == BindingType.SMALL
-        assert calc.binding_price == 1.00
+        assert calc.binding_price == pytest.approx(1.00)
     
     def test_binding_size_mm_is_float(self) -> None:
         """Test: Bindungsgröße in mm ist ein Float (z.B. 6.9, 14.3)."""
@@ -135,30 +168,28 @@ class TestPricingService:
         assert calc.binding_size_mm is not None
         assert isinstance(calc.binding_size_mm, float)
     
-    def test_binding_size_lookup_various_pages(self) -> None:
+    @pytest.mark.parametrize("pages,expected_mm", _BINDING_SIZE_CASES)
+    def test_binding_size_lookup_various_pages(self, pages: int, expected_mm: float) -> None:
         """Test: Korrekte Bindungsgröße für verschiedene Seitenzahlen."""
-        test_cases = [
-            (50, 6.9),     # 1-80 Seiten
-            (90, 8.0),     # 81-100
-            (110, 9.5),    # 101-120
-            (140, 11.0),   # 121-150
-            (170, 12.7),   # 151-180
-            (200, 14.3),   # 181-210
-            (230, 16.0),   # 211-240
-            (270, 19.0),   # 241-300
-            (330, 22.0),   # 301-360
-            (400, 25.4),   # 361-420
-            (450, 28.5),   # 421-480
-            (520, 32.0),   # 481-540
-            (600, 38.0),   # 541-660
+        binding = self.service.get_binding_size_for_pages(pages)
+        assert binding is not None, f"No binding found for {pages} pages"
+        assert binding.size_mm == expected_mm
+    
+    @pytest.mark.parametrize("pages", [0, 661])
+    def test_no_binding_outside_table(self, pages: int) -> None:
+        """Test: Keine Bindungsgröße unterhalb bzw. oberhalb der Tabelle."""
+        assert self.service.get_binding_size_for_pages(pages) is None
+    
+    def test_overlapping_binding_sizes_rejected(self) -> None:
+        """Test: Überlappende Bereiche in der Bindungstabelle werden abgelehnt."""
+        service = PricingService()
+        service._binding_sizes = [
+            BindingSize(min_pages=1, max_pages=100, size_mm=8.0, binding_type=BindingType.SMALL),
+            BindingSize(min_pages=90, max_pages=200, size_mm=10.0, binding_type=BindingType.SMALL),
         ]
         
-        for pages, expected_mm in test_cases:
-            binding = self.service.get_binding_size_for_pages(pages)
-            assert binding is not None, f"No binding found for {pages} pages"
-            assert binding.size_mm == expected_mm, (
-                f"Expected {expected_mm}mm for {pages} pages, got {binding.size_mm}mm"
-            )
+        with pytest.raises(ValueError, match="überschneiden"):
+            service._build_lookup()
     
     def test_no_binding_for_excess_pages(self) -> None:
         """Test: Keine Bindungsgröße für >660 Seiten."""
@@ -0,0 +1,84 @@
+"""Tests für den persistenten LDAP-Benutzercache."""
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skriptendruck.models import User
+from skriptendruck.services import UserService
+from skriptendruck.services.user_cache import UserCache
+
+
+class TestUserCache:
+    """Tests für UserCache und dessen Nutzung im UserService."""
+
+    def setup_method(self) -> None:
+        """Setup für jeden Test."""
+        self.user = User(
+            username="mus12345",
+            first_name="Max",
+            last_name="Mustermann",
+            faculty="M",
+            email="max@example.com",
+        )
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """Test: Gespeicherter Benutzer wird (auch nach Neustart) gefunden."""
+        cache = UserCache(tmp_path / "cache.sqlite", ttl_seconds=3600)
+        cache.put(self.user)
+        cache.close()
+
+        reopened = UserCache(tmp_path / "cache.sqlite", ttl_seconds=3600)
+        user = reopened.get("mus12345")
+
+        assert user is not None
+        assert user.full_name == "Max Mustermann"
+        assert user.email == "max@example.com"
+        assert reopened.get("unbekannt") is None
+
+    def test_expired_entry_is_ignored(self, tmp_path: Path) -> None:
+        """Test: Abgelaufene Einträge werden nicht zurückgegeben."""
+        cache = UserCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+        with patch("skriptendruck.services.user_cache.time.time", return_value=time.time() - 120):
+            cache.put(self.user)
+
+        assert cache.get("mus12345") is None
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test: Einzelne und alle Einträge lassen sich entfernen."""
+        cache = UserCache(tmp_path / "cache.sqlite", ttl_seconds=3600)
+        cache.put(self.user)
+        cache.put(User(username="sch12345", first_name="Lisa", last_name="Schmidt", faculty="I"))
+
+        assert cache.invalidate("mus12345") is True
+        assert cache.invalidate("mus12345") is False
+        assert cache.get("mus12345") is None
+        assert cache.invalidate_all() == 1
+
+    def test_user_service_skips_ldap_on_cache_hit(self, tmp_path: Path) -> None:
+        """Test: get_user fragt LDAP nicht ab, wenn der Benutzer persistent gecacht ist."""
+        UserCache(tmp_path / "cache.sqlite", ttl_seconds=3600).put(self.user)
+        service = UserService()
+
+        with patch("skriptendruck.services.user_service.settings") as mock_settings:
+            mock_settings.ldap_enabled = True
+            mock_settings.user_cache_path = tmp_path / "cache.sqlite"
+            mock_settings.user_cache_ttl_seconds = 3600
+
+            with patch.object(service, "_query_ldap") as mock_query:
+                user = service.get_user("MUS12345")
+
+            assert user is not None
+            assert user.username == "mus12345"
+            mock_query.assert_not_called()
+
+            # Invalidierung erzwingt eine neue LDAP-Abfrage
+            service.invalidate_user("mus12345")
+            with patch.object(service, "_query_ldap", return_value=None) as mock_query:
+                assert service.get_user("mus12345") is None
+                mock_query.assert_called_once_with("mus12345")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
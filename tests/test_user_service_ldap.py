@@ -1,245 +1,383 @@
 """Tests für den UserService mit LDAP."""
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, sentinel
 
 from skriptendruck.models import User
 from skriptendruck.services import UserService
+from skriptendruck.services import user_service as _us_mod
+
+
+# Gemeinsame LDAP-Konfiguration der Tests; Abweichungen setzt der jeweilige Test
+_DEFAULT_LDAP_SETTINGS = dict(
+    ldap_enabled=True,
+    ldap_server="ldap://test.example.com",
+    ldap_base_dn="ou=people,dc=example,dc=com",
+    ldap_bind_dn=None,
+    ldap_bind_password=None,
+    ldap_search_filter="samAccountName={username}",
+    user_cache_path=None,  # Kein persistenter Cache im Test
+)
+
+
+# Vorlage für von _query_ldap gelieferte Benutzer; Tests variieren per model_copy
+_BASE_USER = User(username="test123", first_name="Test", last_name="User", faculty="M")
+
+
+@dataclass(frozen=True)
+class LdapCase:
+    """Szenario für test_query_ldap."""
+    
+    username: str
+    settings: Dict[str, Any] = field(default_factory=dict)  # Abweichungen von den Defaults
+    entries: Tuple[Any, ...] = ()
+    side_effect: Optional[Exception] = None
+    expected: Optional[Dict[str, Any]] = None  # Erwartete User-Attribute; None = kein User
+    check: Optional[Callable[[SimpleNamespace], None]] = None  # Zusätzliche Prüfungen
+
+
+def _fake_server(*args: Any, **kwargs: Any) -> Any:
+    """Ersatz für ldap3.Server: wird nur an die (gemockte) Connection weitergereicht."""
+    return sentinel.ldap_server
+
+
+def _check_single_search(mocks: SimpleNamespace) -> None:
+    """Eine Verbindung, eine Suche; die Verbindung bleibt für weitere Abfragen offen."""
+    mocks.connection.assert_called_once()
+    mocks.connection.return_value.search.assert_called_once()
+    mocks.connection.return_value.unbind.assert_not_called()
+
+
+def _check_bind_credentials(mocks: SimpleNamespace) -> None:
+    """Bind erfolgt mit den konfigurierten Zugangsdaten."""
+    call_kwargs = mocks.connection.call_args[1]
+    assert call_kwargs['user'] == "cn=admin,dc=example,dc=com"
+    assert call_kwargs['password'] == "secret"
+
+
+def _check_no_connection(mocks: SimpleNamespace) -> None:
+    """Ohne Konfiguration wird gar nicht erst verbunden."""
+    mocks.connection.assert_not_called()
+
+
+_QUERY_LDAP_CASES = [
+    pytest.param(LdapCase(
+        username="mus12345",
+        entries=(SimpleNamespace(
+            givenName=SimpleNamespace(value="Max"),
+            sn=SimpleNamespace(value="Mustermann"),
+            mail=SimpleNamespace(value="max.mustermann@example.com"),
+            department=SimpleNamespace(value="Maschinenbau"),
+        ),),
+        expected=dict(
+            username="mus12345",
+            first_name="Max",
+            last_name="Mustermann",
+            email="max.mustermann@example.com",
+            faculty="M",
+        ),
+        check=_check_single_search,
+    ), id="success"),
+    pytest.param(LdapCase(
+        username="sch12345",
+        settings=dict(ldap_bind_dn="cn=admin,dc=example,dc=com", ldap_bind_password="secret"),
+        entries=(SimpleNamespace(
+            givenName=SimpleNamespace(value="Lisa"),
+            sn=SimpleNamespace(value="Schmidt"),
+            mail=SimpleNamespace(value="lisa.schmidt@example.com"),
+            department=SimpleNamespace(value="Informatik"),
+        ),),
+        expected=dict(username="sch12345", faculty="I"),
+        check=_check_bind_credentials,
+    ), id="with_authentication"),
+    pytest.param(LdapCase(username="nonexistent"), id="user_not_found"),
+    pytest.param(LdapCase(
+        username="test",
+        settings=dict(ldap_server=None, ldap_base_dn=None),
+        check=_check_no_connection,
+    ), id="not_configured"),
+    pytest.param(LdapCase(
+        username="test",
+        side_effect=Exception("Connection failed"),
+    ), id="connection_error"),
+    pytest.param(LdapCase(
+        username="mus12345",
+        # Mehrwertige Attribute: jeweils der erste Wert zählt
+        entries=(SimpleNamespace(
+            givenName=SimpleNamespace(value=["Max", "Maximilian"]),
+            sn=SimpleNamespace(value=["Mustermann"]),
+            mail=SimpleNamespace(value=["max@example.com", "max.m@example.com"]),
+            department=SimpleNamespace(value=["Maschinenbau"]),
+        ),),
+        expected=dict(
+            first_name="Max",
+            last_name="Mustermann",
+            email="max@example.com",
+            faculty="M",
+        ),
+    ), id="with_list_attributes"),
+]
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> UserService:
+    """Frischer UserService je Test, unabhängig von lokaler Blacklist/CSV in data/."""
+    monkeypatch.setattr(_us_mod.settings, 'blacklist_path', tmp_path / "blacklist.txt")
+    monkeypatch.setattr(_us_mod.settings, 'users_csv_path', tmp_path / "users.csv")
+    return UserService()
+
+
+@pytest.fixture
+def ldap_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Ersetzt Connection und settings (mit _DEFAULT_LDAP_SETTINGS) durch Mocks, Server durch ein Sentinel."""
+    mocks = SimpleNamespace(connection=MagicMock(), settings=MagicMock())
+    mocks.settings.configure_mock(**_DEFAULT_LDAP_SETTINGS)
+    monkeypatch.setattr(_us_mod, 'Server', _fake_server)
+    monkeypatch.setattr(_us_mod, 'Connection', mocks.connection)
+    monkeypatch.setattr(_us_mod, 'settings', mocks.settings)
+    return mocks
 
 
 class TestUserServiceLDAP:
     """Tests für LDAP-Funktionalität im UserService."""
     
-    def setup_method(self) -> None:
-        """Setup für jeden Test."""
-        self.service = UserService()
+    @pytest.fixture(autouse=True)
+    def _isolated_blacklist(self, service: UserService) -> Iterator[None]:
+        """Jeder Test startet mit leerer Blacklist und hinterlässt keine Einträge."""
+        assert not service._blacklist
+        yield
+        service._blacklist.clear()
     
-    @patch('skriptendruck.services.user_service.settings')
-    @patch('skriptendruck.services.user_service.Connection')
-    @patch('skriptendruck.services.user_service.Server')
-    def test_ldap_query_success(self, mock_server, mock_connection, mock_settings) -> None:
-        """Test: Erfolgreiche LDAP-Abfrage."""
-        # Settings mocken
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = "ldap://test.example.com"
-        mock_settings.ldap_base_dn = "ou=people,dc=example,dc=com"
-        mock_settings.ldap_bind_dn = None
-        mock_settings.ldap_bind_password = None
-        
-        # LDAP Entry mocken
-        mock_entry = MagicMock()
-        mock_entry.givenName.value = "Max"
-        mock_entry.sn.value = "Mustermann"
-        mock_entry.mail.value = "max.mustermann@example.com"
-        mock_entry.ou.value = "Maschinenbau"
-        
-        # Connection mocken
-        mock_conn_instance = MagicMock()
-        mock_conn_instance.entries = [mock_entry]
-        mock_connection.return_value = mock_conn_instance
+    @pytest.mark.parametrize("case", _QUERY_LDAP_CASES)
+    def test_query_ldap(
+        self, case: LdapCase, ldap_mocks: SimpleNamespace, service: UserService
+    ) -> None:
+        """Test: _query_ldap für Erfolg, Bind, Nicht-gefunden und Fehlerfälle."""
+        ldap_mocks.settings.configure_mock(**case.settings)
+        ldap_mocks.connection.return_value.entries = list(case.entries)
+        ldap_mocks.connection.side_effect = case.side_effect
         
-        # Test
-        user = self.service._query_ldap("mus12345")
+        user = service._query_ldap(case.username)
         
-        assert user is not None
-        assert user.username == "mus12345"
-        assert user.first_name == "Max"
-        assert user.last_name == "Mustermann"
-        assert user.email == "max.mustermann@example.com"
-        assert user.faculty == "M"
-        
-        # Verify LDAP calls
-        mock_connection.assert_called_once()
-        mock_conn_instance.search.assert_called_once()
-        mock_conn_instance.unbind.assert_called_once()
+        if case.expected is None:
+            assert user is None
+        else:
+            assert user is not None
+            for attribute, value in case.expected.items():
+                assert getattr(user, attribute) == value, attribute
+        if case.check:
+            case.check(ldap_mocks)
     
-    @patch('skriptendruck.services.user_service.settings')
-    @patch('skriptendruck.services.user_service.Connection')
-    @patch('skriptendruck.services.user_service.Server')
-    def test_ldap_query_with_authentication(
-        self, mock_server, mock_connection, mock_settings
+    def test_ldap_connection_reused(
+        self, ldap_mocks: SimpleNamespace, service: UserService
     ) -> None:
-        """Test: LDAP-Abfrage mit Authentifizierung."""
-        # Settings mit Credentials mocken
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = "ldap://test.example.com"
-        mock_settings.ldap_base_dn = "ou=people,dc=example,dc=com"
-        mock_settings.ldap_bind_dn = "cn=admin,dc=example,dc=com"
-        mock_settings.ldap_bind_password = "secret"
-        
-        # LDAP Entry mocken
-        mock_entry = MagicMock()
-        mock_entry.givenName.value = "Lisa"
-        mock_entry.sn.value = "Schmidt"
-        mock_entry.mail.value = "lisa.schmidt@example.com"
-        mock_entry.ou.value = "Informatik"
-        
-        # Connection mocken
+        """Test: Mehrere Abfragen nutzen dieselbe gebundene Verbindung."""
         mock_conn_instance = MagicMock()
-        mock_conn_instance.entries = [mock_entry]
-        mock_connection.return_value = mock_conn_instance
+        mock_conn_instance.entries = []
+        ldap_mocks.connection.return_value = mock_conn_instance
         
-        # Test
-        user = self.service._query_ldap("sch12345")
+        for username in ("abc12345", "def67890", "ghi24680"):
+            service._query_ldap(username)
         
-        assert user is not None
-        assert user.username == "sch12345"
-        assert user.faculty == "I"
-        
-        # Verify authentication was used
-        mock_connection.assert_called_once()
-        call_kwargs = mock_connection.call_args[1]
-        assert call_kwargs['user'] == "cn=admin,dc=example,dc=com"
-        assert call_kwargs['password'] == "secret"
-    
-    @patch('skriptendruck.services.user_service.settings')
-    @patch('skriptendruck.services.user_service.Connection')
-    @patch('skriptendruck.services.user_service.Server')
-    def test_ldap_query_user_not_found(
-        self, mock_server, mock_connection, mock_settings
+        # Server, Connection und Bind nur einmal, danach nur noch Suchen
+        assert service._ldap_server is sentinel.ldap_server
+        ldap_mocks.connection.assert_called_once()
+        assert ldap_mocks.connection.call_args[0][0] is sentinel.ldap_server
+        assert mock_conn_instance.search.call_count == 3
+        
+        service.close()
+        mock_conn_instance.unbind.assert_called_once()
+
+    def test_ldap_query_miss_is_cached(
+        self, ldap_mocks: SimpleNamespace, service: UserService
     ) -> None:
-        """Test: LDAP-Abfrage wenn Benutzer nicht gefunden."""
-        # Settings mocken
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = "ldap://test.example.com"
-        mock_settings.ldap_base_dn = "ou=people,dc=example,dc=com"
-        mock_settings.ldap_bind_dn = None
-        mock_settings.ldap_bind_password = None
-        
-        # Connection mocken - keine Einträge
+        """Test: "Nicht gefunden" wird bis zum Ablauf von LDAP_MISS_TTL gemerkt."""
         mock_conn_instance = MagicMock()
         mock_conn_instance.entries = []
-        mock_connection.return_value = mock_conn_instance
+        ldap_mocks.connection.return_value = mock_conn_instance
         
-        # Test
-        user = self.service._query_ldap("nonexistent")
+        assert service._query_ldap("nonexistent") is None
+        assert service._query_ldap("nonexistent") is None
+        assert mock_conn_instance.search.call_count == 1
         
-        assert user is None
-    
-    @patch('skriptendruck.services.user_service.settings')
-    def test_ldap_query_not_configured(self, mock_settings) -> None:
-        """Test: LDAP-Abfrage ohne Konfiguration."""
-        # Settings ohne LDAP-Konfiguration
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = None
-        mock_settings.ldap_base_dn = None
-        
-        # Test
-        user = self.service._query_ldap("test")
-        
-        assert user is None
+        later = time.monotonic() + UserService.LDAP_MISS_TTL + 1
+        with patch.object(_us_mod.time, 'monotonic', return_value=later):
+            assert service._query_ldap("nonexistent") is None
+        assert mock_conn_instance.search.call_count == 2
+        
+        # Invalidierung verwirft auch den gemerkten Fehltreffer
+        service.invalidate_user("nonexistent")
+        assert service._query_ldap("nonexistent") is None
+        assert mock_conn_instance.search.call_count == 3
     
-    @patch('skriptendruck.services.user_service.settings')
-    @patch('skriptendruck.services.user_service.Connection')
-    @patch('skriptendruck.services.user_service.Server')
-    def test_ldap_query_connection_error(
-        self, mock_server, mock_connection, mock_settings
+    def test_ldap_query_filter_escaped_and_limited(
+        self, ldap_mocks: SimpleNamespace, service: UserService
     ) -> None:
-        """Test: LDAP-Abfrage mit Verbindungsfehler."""
-        # Settings mocken
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = "ldap://test.example.com"
-        mock_settings.ldap_base_dn = "ou=people,dc=example,dc=com"
+        """Test: Username wird im Filter escaped, Suche auf einen Treffer begrenzt."""
+        ldap_mocks.settings.ldap_search_filter = (
+            "(&(objectCategory=person)(samAccountName={username}))"
+        )
+
+        mock_conn_instance = MagicMock()
+        mock_conn_instance.entries = []
+        ldap_mocks.connection.return_value = mock_conn_instance
+
+        service._query_ldap("abc*)(x")
+
+        call_kwargs = mock_conn_instance.search.call_args[1]
+        assert call_kwargs["search_filter"] == (
+            "(&(objectCategory=person)(samAccountName=abc\\2a\\29\\28x))"
+        )
+        assert call_kwargs["size_limit"] == 1
+        assert call_kwargs["time_limit"] == UserService.LDAP_TIME_LIMIT
+
+    def test_get_users_single_search(
+        self, ldap_mocks: SimpleNamespace, service: UserService
+    ) -> None:
+        """Test: Mehrere Benutzer werden mit einer OR-Suche geholt."""
+        entries = []
+        for username, first, last in [("ABC12345", "Max", "Muster"), ("def67890", "Lisa", "Schmidt")]:
+            entry = MagicMock()
+            entry.samAccountName.value = username
+            entry.givenName.value = first
+            entry.sn.value = last
+            entry.mail.value = None
+            entry.department.value = "Maschinenbau"
+            entries.append(entry)
         
-        # Connection wirft Fehler
-        mock_connection.side_effect = Exception("Connection failed")
+        mock_conn_instance = MagicMock()
+        mock_conn_instance.entries = entries
+        ldap_mocks.connection.return_value = mock_conn_instance
+        
+        users = service.get_users(["abc12345", "def67890", "xyz00000", "abc12345"])
         
-        # Test
-        user = self.service._query_ldap("test")
+        assert set(users) == {"abc12345", "def67890"}
+        assert users["def67890"].full_name == "Lisa Schmidt"
+        mock_conn_instance.search.assert_called_once()
+        search_filter = mock_conn_instance.search.call_args[1]["search_filter"]
+        assert search_filter == (
+            "(|(samAccountName=abc12345)(samAccountName=def67890)(samAccountName=xyz00000))"
+        )
         
-        assert user is None
+        # Zweiter Aufruf kommt komplett aus dem Cache, auch der Fehltreffer
+        assert service.get_user("abc12345") is users["abc12345"]
+        assert service.get_user("xyz00000") is None
+        mock_conn_instance.search.assert_called_once()
     
-    @patch('skriptendruck.services.user_service.settings')
-    @patch('skriptendruck.services.user_service.Connection')
-    @patch('skriptendruck.services.user_service.Server')
-    def test_ldap_query_with_list_attributes(
-        self, mock_server, mock_connection, mock_settings
+    def test_get_users_other_filter_attribute_no_misses(
+        self, ldap_mocks: SimpleNamespace, service: UserService
     ) -> None:
-        """Test: LDAP-Abfrage wenn Attribute als Liste zurückgegeben werden."""
-        # Settings mocken
-        mock_settings.ldap_enabled = True
-        mock_settings.ldap_server = "ldap://test.example.com"
-        mock_settings.ldap_base_dn = "ou=people,dc=example,dc=com"
-        mock_settings.ldap_bind_dn = None
-        mock_settings.ldap_bind_password = None
-        
-        # LDAP Entry mit Listen-Attributen mocken
-        mock_entry = MagicMock()
-        mock_entry.givenName.value = ["Max", "Maximilian"]  # Liste
-        mock_entry.sn.value = ["Mustermann"]  # Liste
-        mock_entry.mail.value = ["max@example.com", "max.m@example.com"]  # Liste
-        mock_entry.ou.value = ["Maschinenbau"]  # Liste
-        
-        # Connection mocken
+        """Test: Ohne samAccountName im Filter werden keine Fehltreffer gemerkt."""
+        ldap_mocks.settings.ldap_search_filter = "uid={username}"
         mock_conn_instance = MagicMock()
-        mock_conn_instance.entries = [mock_entry]
-        mock_connection.return_value = mock_conn_instance
+        # Verzeichnis liefert kein samAccountName zurück
+        mock_conn_instance.entries = [SimpleNamespace(
+            givenName=SimpleNamespace(value="Max"),
+            sn=SimpleNamespace(value="Muster"),
+            mail=SimpleNamespace(value=None),
+            department=SimpleNamespace(value="Maschinenbau"),
+        )]
+        ldap_mocks.connection.return_value = mock_conn_instance
         
-        # Test
-        user = self.service._query_ldap("mus12345")
+        assert service.get_users(["abc12345"]) == {}
         
+        # get_user fragt einzeln nach und findet den Benutzer
+        user = service.get_user("abc12345")
         assert user is not None
-        assert user.first_name == "Max"  # Erster Wert der Liste
-        assert user.last_name == "Mustermann"  # Erster Wert der Liste
-        assert user.email == "max@example.com"  # Erster Wert der Liste
+        assert user.full_name == "Max Muster"
+        assert mock_conn_instance.search.call_count == 2
     
-    def test_get_user_with_ldap_enabled(self) -> None:
+    def test_get_user_with_ldap_enabled(self, service: UserService) -> None:
         """Test: get_user nutzt LDAP wenn aktiviert."""
-        with patch.object(self.service, '_query_ldap') as mock_query:
-            mock_user = User(
-                username="test123",
-                first_name="Test",
-                last_name="User",
-                faculty="M"
-            )
-            mock_query.return_value = mock_user
+        with patch.object(service, '_query_ldap') as mock_query:
+            mock_query.return_value = _BASE_USER.model_copy()
             
-            with patch('skriptendruck.services.user_service.settings') as mock_settings:
+            with patch.object(_us_mod, 'settings') as mock_settings:
                 mock_settings.ldap_enabled = True
+                mock_settings.user_cache_path = None  # Kein persistenter Cache im Test
                 
-                user = self.service.get_user("test123")
+                user = service.get_user("test123")
                 
                 assert user is not None
                 assert user.username == "test123"
                 mock_query.assert_called_once_with("test123")
     
-    def test_get_user_blacklist_check(self) -> None:
+    def test_get_user_cache_hit_skips_ldap(
+        self, ldap_mocks: SimpleNamespace, service: UserService
+    ) -> None:
+        """Test: Bei einem Cache-Treffer wird LDAP gar nicht erst verbunden."""
+        with patch.object(service, '_query_ldap', return_value=_BASE_USER.model_copy()) as mock_query:
+            first = service.get_user("test123")
+            second = service.get_user("TEST123")
+        
+        assert second is first
+        assert mock_query.call_count == 1
+        ldap_mocks.connection.assert_not_called()
+    
+    def test_get_user_blacklist_check(self, service: UserService) -> None:
         """Test: get_user prüft Blacklist nach LDAP-Abfrage."""
         # Blacklist vorbereiten
-        self.service._blacklist.add("blocked123")
-        
-        with patch.object(self.service, '_query_ldap') as mock_query:
-            mock_user = User(
-                username="blocked123",
-                first_name="Blocked",
-                last_name="User",
-                faculty="M"
+        service._blacklist.add("blocked123")
+        
+        with patch.object(service, '_query_ldap') as mock_query:
+            mock_query.return_value = _BASE_USER.model_copy(
+                update={"username": "blocked123", "first_name": "Blocked"}
             )
-            mock_query.return_value = mock_user
             
-            with patch('skriptendruck.services.user_service.settings') as mock_settings:
+            with patch.object(_us_mod, 'settings') as mock_settings:
                 mock_settings.ldap_enabled = True
+                mock_settings.user_cache_path = None  # Kein persistenter Cache im Test
                 
-                user = self.service.get_user("blocked123")
+                user = service.get_user("blocked123")
                 
                 assert user is not None
                 assert user.is_blocked is True
+                assert user.model_dump()["is_blocked"] is True
+
+                # Blacklist-Änderungen wirken auch auf bereits gecachte Benutzer
+                service._blacklist.discard("blocked123")
+                assert service.get_user("blocked123").is_blocked is False
+                mock_query.assert_called_once()
+
+    def test_get_user_by_name_uses_index(self, service: UserService) -> None:
+        """Test: Per LDAP gefundene Benutzer sind auch über den Namen auffindbar."""
+        with patch.object(service, '_query_ldap') as mock_query:
+            mock_query.return_value = _BASE_USER.model_copy(
+                update={"username": "mus12345", "first_name": "Max", "last_name": "Mustermann"}
+            )
+            
+            with patch.object(_us_mod, 'settings') as mock_settings:
+                mock_settings.ldap_enabled = True
+                mock_settings.user_cache_path = None  # Kein persistenter Cache im Test
+                service.get_user("mus12345")
+                
+                user = service.get_user_by_name("max", "MUSTERMANN")
+                
+                assert user is not None
+                assert user.username == "mus12345"
+                assert service.get_user_by_name("Erika", "Mustermann") is None
     
-    def test_faculty_code_mapping(self) -> None:
+    @pytest.mark.parametrize("faculty_name,expected_code", [
+        ("Maschinenbau", "M"),
+        ("Elektrotechnik", "E"),
+        ("Informatik", "I"),
+        ("Bauingenieurwesen", "B"),
+        ("Architektur", "A"),
+        ("Betriebswirtschaft", "BW"),
+        ("Fakultät Informatik und Mathematik", "I"),  # Name als Teil des Textes
+        ("Unknown Faculty", "U"),  # Fallback: Erster Buchstabe
+        ("", "?"),  # Leerer String
+    ])
+    def test_faculty_code_mapping(
+        self, faculty_name: str, expected_code: str, service: UserService
+    ) -> None:
         """Test: Fakultätsnamen werden korrekt zu Codes gemappt."""
-        test_cases = [
-            ("Maschinenbau", "M"),
-            ("Elektrotechnik", "E"),
-            ("Informatik", "I"),
-            ("Bauingenieurwesen", "B"),
-            ("Architektur", "A"),
-            ("Betriebswirtschaft", "BW"),
-            ("Unknown Faculty", "U"),  # Fallback: Erster Buchstabe
-            ("", "?"),  # Leerer String
-        ]
-        
-        for faculty_name, expected_code in test_cases:
-            result = self.service._get_faculty_code(faculty_name)
-            assert result == expected_code, f"Failed for {faculty_name}"
+        assert service._get_faculty_code(faculty_name) == expected_code
 
 
 if __name__ == "__main__":